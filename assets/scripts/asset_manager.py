@@ -0,0 +1,230 @@
+import pygame as pg
+import threading
+import weakref
+import queue
+import glob
+
+from collections import OrderedDict
+
+BUILTIN_SKINS: frozenset[str] = frozenset({"yellow", "blue", "red", "mario", "kirby", "plane"})
+
+def preload_manifest() -> list[tuple[str, bool]]:
+	# (path, alpha) for every shipped image, backgrounds and grounds are opaque
+	opaque: list[str] = sorted(glob.glob("assets/sprites/background/*.png") + glob.glob("assets/sprites/obstacle/ground_*.png"))
+	transparent: list[str] = sorted(path for path in glob.glob("assets/sprites/obstacle/*.png") + glob.glob("assets/sprites/ui/*.png") if path not in opaque)
+
+	return [(path, False) for path in opaque] + [(path, True) for path in transparent]
+
+class AssetManager:
+	def __init__(self, max_imported_skins: int = 8) -> None:
+		self.images: dict[tuple[str, bool], pg.Surface] = {}
+
+		# Shipped skins stay resident, user-imported ones are evicted least recently used first
+		self.skins: dict[str, list[pg.Surface]] = {}
+		self.imported_skins: OrderedDict[str, list[pg.Surface]] = OrderedDict()
+		self.max_imported_skins: int = max_imported_skins
+
+		# Pre-rotated frames and masks per skin, keyed by (frame index, angle)
+		self.rotations: dict[str, dict[tuple[int, int], tuple[pg.Surface, pg.Mask]]] = {}
+
+		# Pipe columns keyed by (theme image, height, upper), all views into the theme image or its flipped copy
+		self.pipe_columns: dict[tuple[str, int, int, bool], pg.Surface] = {}
+		self.flipped: dict[str, pg.Surface] = {}
+
+		# Ground tiles repeated to one tile wider than the screen, keyed by (tile image, screen width)
+		self.ground_strips: dict[tuple[str, int], pg.Surface] = {}
+
+		# Copies of any surface pre-scaled to the output resolution, dropped together with the surface they were made from
+		self.scale: float = 1
+		self.variants: weakref.WeakKeyDictionary[pg.Surface, pg.Surface] = weakref.WeakKeyDictionary()
+		self.variant_misses: int = 0 # variants first asked for while drawing, each one a resize inside a frame
+
+		self.disk_reads: int = 0
+
+		# Filled by the preloader thread with decoded but unconverted images, drained on the main thread by collect()
+		self.decoded: queue.SimpleQueue = queue.SimpleQueue()
+		self.preload_total: int = 0
+		self.preloaded: int = 0
+
+	def load(self, path: str, alpha: bool = True) -> pg.Surface:
+		self.disk_reads += 1
+		image: pg.Surface = pg.image.load(path)
+
+		return image.convert_alpha() if alpha else image.convert()
+
+	def image(self, path: str, alpha: bool = True) -> pg.Surface:
+		key: tuple[str, bool] = (path, alpha)
+		image: pg.Surface | None = self.images.get(key)
+		if image is None:
+			image = self.load(path, alpha)
+			self.images[key] = image
+
+		return image
+
+	def preload(self, images: list[tuple[str, bool]], skins: dict[str, list[str]]) -> None:
+		# Decoding PNGs doesn't need the display, converting to its pixel format stays on the main thread
+		self.preload_total += len(images) + len(skins)
+		threading.Thread(target=self.decode, args=(images, skins), daemon=True).start()
+
+	def decode(self, images: list[tuple[str, bool]], skins: dict[str, list[str]]) -> None:
+		for path, alpha in images:
+			try:
+				self.decoded.put((path, alpha, pg.image.load(path)))
+
+			except (pg.error, FileNotFoundError):
+				# Left to the normal lazy load, which raises where the image is actually used
+				self.decoded.put((path, alpha, None))
+
+		for skin, paths in skins.items():
+			try:
+				self.decoded.put((skin, True, [pg.image.load(path) for path in paths]))
+
+			except (pg.error, FileNotFoundError):
+				self.decoded.put((skin, True, None))
+
+	def collect(self) -> bool:
+		while True:
+			try:
+				key, alpha, decoded = self.decoded.get_nowait()
+
+			except queue.Empty:
+				break
+
+			self.preloaded += 1
+			if decoded is None:
+				continue
+
+			if isinstance(decoded, list):
+				self.disk_reads += len(decoded)
+				self.skins.setdefault(key, [image.convert_alpha() for image in decoded])
+
+			else:
+				self.disk_reads += 1
+				self.images.setdefault((key, alpha), decoded.convert_alpha() if alpha else decoded.convert())
+
+		return self.preloaded >= self.preload_total
+
+	@property
+	def progress(self) -> float:
+		return self.preloaded / self.preload_total if self.preload_total else 1
+
+	def set_scale(self, scale: float) -> None:
+		if scale != self.scale:
+			self.scale = scale
+			self.variants.clear()
+
+	def prescale(self, surface: pg.Surface) -> pg.Surface:
+		# Called where a surface is created, so the frame that first draws it finds its variant ready
+		if self.scale == 1:
+			return surface
+
+		scaled: pg.Surface | None = self.variants.get(surface)
+		if scaled is None:
+			size: tuple[int, int] = (max(1, round(surface.get_width() * self.scale)), max(1, round(surface.get_height() * self.scale)))
+			scaled = pg.transform.smoothscale(surface, size) if surface.get_bitsize() >= 24 else pg.transform.scale(surface, size)
+			self.variants[surface] = scaled
+
+		return scaled
+
+	def variant(self, surface: pg.Surface) -> pg.Surface:
+		scaled: pg.Surface | None = self.variants.get(surface)
+		if scaled is None:
+			self.variant_misses += 1
+			scaled = self.prescale(surface)
+
+		return scaled
+
+	def add_variant(self, surface: pg.Surface, scaled: pg.Surface) -> None:
+		# For surfaces that can be rendered natively at the output size instead of scaled, like text
+		self.variants[surface] = scaled
+
+	def build_variants(self) -> None:
+		# Everything loaded or built so far, run behind the loading screen
+		surfaces: list[pg.Surface] = list(self.images.values()) + list(self.flipped.values()) + list(self.ground_strips.values())
+		surfaces += [frame for frames in list(self.skins.values()) + list(self.imported_skins.values()) for frame in frames]
+		surfaces += [rotated for rotations in self.rotations.values() for rotated, _ in rotations.values()]
+		for surface in surfaces:
+			self.prescale(surface)
+
+	def pipe_column(self, path: str, width: int, height: int, upper: bool) -> pg.Surface:
+		key: tuple[str, int, int, bool] = (path, width, height, upper)
+		column: pg.Surface | None = self.pipe_columns.get(key)
+		if column is None:
+			# The flipped top of the image is the bottom of the flipped image, so one flip per theme covers every height.
+			# Cut to the pipe's width, wider images like the buildings would otherwise be drawn past their hitbox
+			image: pg.Surface = self.flipped_image(path) if upper else self.image(path)
+			top: int = image.get_height() - height if upper else 0
+			column = image.subsurface((0, top, min(width, image.get_width()), height))
+
+			if self.scale != 1:
+				# The scaled column is the same view into the scaled image, nothing is resized here
+				scaled: pg.Surface = self.prescale(image)
+				scaled_width: int = min(scaled.get_width(), round(column.get_width() * self.scale))
+				scaled_height: int = min(scaled.get_height(), round(height * self.scale))
+				scaled_top: int = scaled.get_height() - scaled_height if upper else 0
+				self.variants[column] = scaled.subsurface((0, scaled_top, scaled_width, scaled_height))
+
+			self.pipe_columns[key] = column
+
+		return column
+
+	def flipped_image(self, path: str) -> pg.Surface:
+		flipped: pg.Surface | None = self.flipped.get(path)
+		if flipped is None:
+			flipped = pg.transform.flip(self.image(path), False, True)
+			self.flipped[path] = flipped
+
+		return flipped
+
+	def ground_strip(self, path: str, width: int) -> pg.Surface:
+		key: tuple[str, int] = (path, width)
+		strip: pg.Surface | None = self.ground_strips.get(key)
+		if strip is None:
+			tile: pg.Surface = self.image(path, alpha=False)
+			strip = pg.Surface((width + tile.get_width(), tile.get_height())).convert()
+			for x in range(0, strip.get_width(), tile.get_width()):
+				strip.blit(tile, (x, 0))
+
+			self.ground_strips[key] = strip
+			self.prescale(strip)
+
+		return strip
+
+	def skin_frames(self, skin: str, paths: list[str]) -> list[pg.Surface]:
+		frames: list[pg.Surface] | None = self.skins.get(skin)
+		if frames is not None:
+			return frames
+
+		frames = self.imported_skins.get(skin)
+		if frames is not None:
+			self.imported_skins.move_to_end(skin)
+			return frames
+
+		frames = [self.load(path) for path in paths]
+
+		if skin in BUILTIN_SKINS:
+			self.skins[skin] = frames
+
+		else:
+			self.add_imported_skin(skin, frames)
+
+		return frames
+
+	def add_imported_skin(self, skin: str, frames: list[pg.Surface], rotations: dict[tuple[int, int], tuple[pg.Surface, pg.Mask]] | None = None) -> None:
+		self.imported_skins[skin] = frames
+		for frame in frames:
+			self.prescale(frame)
+
+		if rotations is not None:
+			self.rotations[skin] = rotations
+			for rotated, _ in rotations.values():
+				self.prescale(rotated)
+
+		while len(self.imported_skins) > self.max_imported_skins:
+			evicted, _ = self.imported_skins.popitem(last=False)
+			self.rotations.pop(evicted, None)
+
+	def evict_skin(self, skin: str) -> None:
+		self.skins.pop(skin, None)
+		self.imported_skins.pop(skin, None)
+		self.rotations.pop(skin, None)
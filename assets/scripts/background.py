@@ -2,37 +2,55 @@ import pygame as pg
 
 from bird import Bird
 
+class Scroll:
+	# World distance scrolled in whole pixels, the ground and the pipes both move by its per-step delta so they can't drift apart
+	__slots__ = ("offset", "prev_offset")
+
+	def __init__(self) -> None:
+		self.offset: int = 0
+		self.prev_offset: int = 0
+
+	def advance(self, distance: int) -> None:
+		self.prev_offset = self.offset
+		self.offset += distance
+
+	def hold(self) -> None:
+		self.prev_offset = self.offset
+
+	@property
+	def delta(self) -> int:
+		return self.offset - self.prev_offset
+
+	def interpolated(self, alpha: float) -> int:
+		return round(self.prev_offset + (self.offset - self.prev_offset) * alpha)
+
 class Background:
 	def __init__(self, game, bird_instance: Bird) -> None:
 		self.screen_width: int = game.screen_width
 		self.screen_height: int = game.screen_height
 
 		self.bird_instance: Bird = bird_instance
+		self.assets: 'AssetManager' = game.assets # type: ignore
+		self.scroll: Scroll = game.scroll
 
-		self.ground_image: pg.Surface = pg.image.load(f"assets/sprites/obstacle/ground_{self.bird_instance.mode}.png").convert()
-		self.ground_width: int = self.ground_image.get_width()
-
-		self.ground_x1: int = 0
-		self.ground_x2: int = self.ground_x1 + self.ground_width
 		self.ground_y: int = self.screen_height - 28
 
-	def ground_move(self) -> None:
-		if not self.bird_instance.dead:
-			self.ground_x1 -= self.bird_instance.vel_x
-			self.ground_x2 -= self.bird_instance.vel_x
+	def ground_path(self) -> str:
+		return f"assets/sprites/obstacle/ground_{self.bird_instance.mode}.png"
 
-			if self.ground_x1 <= -self.ground_width:
-				self.ground_x1 = self.ground_x2 + self.ground_width
+	def prepare(self) -> None:
+		for mode in ("normal", "impossible"):
+			self.assets.ground_strip(f"assets/sprites/obstacle/ground_{mode}.png", self.screen_width)
 
-			if self.ground_x2 <= -self.ground_width:
-				self.ground_x2 = self.ground_x1 + self.ground_width
+	def update(self) -> None:
+		if not self.bird_instance.dead:
+			self.scroll.advance(self.bird_instance.vel_x)
 
-	def update(self, screen: pg.Surface) -> None:
-		if self.bird_instance.menu in {"main", "play", "death"}:
-			self.ground_move()
-		self.render(screen)
+		else:
+			self.scroll.hold()
 
-	def render(self, screen: pg.Surface) -> None:
-		self.ground_image = pg.image.load(f"assets/sprites/obstacle/ground_{self.bird_instance.mode}.png").convert()
-		screen.blit(self.ground_image, (self.ground_x1, self.ground_y))
-		screen.blit(self.ground_image, (self.ground_x2, self.ground_y))
+	def render(self, screen: pg.Surface, alpha: float = 1) -> None:
+		# One blit of a screen-wide window into the pre-tiled strip, the window wraps every tile width
+		strip: pg.Surface = self.assets.ground_strip(self.ground_path(), self.screen_width)
+		tile_width: int = strip.get_width() - self.screen_width
+		screen.blit(strip, (0, self.ground_y), (self.scroll.interpolated(alpha) % tile_width, 0, self.screen_width, strip.get_height()))
@@ -0,0 +1,161 @@
+import numpy as np
+import time
+
+from simulation import FLOOR_Y, CEILING_Y, PROFILES, PhysicsProfile, PipeCourse, Simulation, gap_controller, gap_flap
+
+class BatchSimulation:
+	# Advances n independent birds through one shared pipe course, one NumPy array per bird attribute
+	def __init__(self, n: int, profile: PhysicsProfile | str = "normal", seed: int | None = None, screen_width: int = 800, screen_height: int = 600) -> None:
+		self.n: int = n
+		self.profile: PhysicsProfile = PROFILES[profile] if isinstance(profile, str) else profile
+
+		self.screen_width: int = screen_width
+		self.screen_height: int = screen_height
+
+		self.bird_width: int = 50
+		self.bird_height: int = 50
+
+		self.course: PipeCourse = PipeCourse(self.profile, seed, screen_width, screen_height)
+		self.bird_x: int = self.course.bird_x
+
+		self.y: np.ndarray = np.empty(n, dtype=np.float64)
+		self.vel_y: np.ndarray = np.empty(n, dtype=np.float64)
+		self.alive: np.ndarray = np.empty(n, dtype=bool)
+		self.score: np.ndarray = np.empty(n, dtype=np.int64)
+		self.death_frame: np.ndarray = np.empty(n, dtype=np.int64)
+
+		# Scratch buffers reused every step
+		self.top: np.ndarray = np.empty(n, dtype=np.float64)
+		self.hit: np.ndarray = np.empty(n, dtype=bool)
+		self.scratch: np.ndarray = np.empty(n, dtype=bool)
+
+		self.reset(seed)
+
+	def reset(self, seed: int | None = None, y: float | np.ndarray = 250, vel_y: float | np.ndarray = 0) -> None:
+		self.course.reset(seed)
+
+		self.y[:] = y
+		self.vel_y[:] = vel_y
+		self.alive[:] = True
+		self.score[:] = 0
+		self.death_frame[:] = -1
+
+		self.frame: int = 0
+
+	@property
+	def seed(self) -> int:
+		return self.course.seed
+
+	def pixel_tops(self) -> np.ndarray:
+		# Vectorized simulation.pixel(y + 10): pg.Rect rounds half away from zero
+		top: np.ndarray = self.top
+		np.add(self.y, 10, out=top)
+		np.copysign(np.floor(np.abs(top) + 0.5), top, out=top)
+
+		return top
+
+	def step(self, flaps: np.ndarray | bool = False) -> int:
+		# One "play" frame for every bird still alive, in the same order as Simulation.step
+		alive: np.ndarray = self.alive
+		if not alive.any():
+			return 0
+
+		profile: PhysicsProfile = self.profile
+		scratch: np.ndarray = self.scratch
+		if isinstance(flaps, np.ndarray):
+			np.logical_and(flaps, alive, out=scratch)
+			self.vel_y[scratch] = profile.jump_strength
+
+		elif flaps:
+			self.vel_y[alive] = profile.jump_strength
+
+		passed: int = self.course.advance()
+		if passed:
+			self.score[alive] += passed
+
+		top: np.ndarray = self.pixel_tops()
+		hit: np.ndarray = self.hit
+		np.greater_equal(self.y, FLOOR_Y, out=hit)
+
+		# Every bird shares x, so the horizontal overlap is one scalar test per pipe and only the gap test is vectorized
+		left: int = int(self.bird_x + 15 + 0.5)
+		for pipe in self.course.pipes:
+			pipe_x: int = int(pipe.x)
+			if not (left < pipe_x + self.course.pipe_width and pipe_x < left + self.bird_width):
+				continue
+
+			if pipe.y > 0:
+				np.less(top, pipe.y, out=scratch)
+				scratch &= top > -self.bird_height
+				hit |= scratch
+
+			lower_top: int = pipe.y + self.course.gap
+			if self.screen_height - lower_top > 0:
+				np.greater(top + self.bird_height, lower_top, out=scratch)
+				scratch &= top < self.screen_height
+				hit |= scratch
+
+		hit &= alive
+		if hit.any():
+			self.vel_y[hit] = 0
+			self.death_frame[hit] = self.frame
+
+		# fall() for every bird that was alive at the start of the frame, including the ones that just died
+		moving: np.ndarray = alive
+		y: np.ndarray = np.where(moving, self.y + self.vel_y, self.y)
+		vel_y: np.ndarray = np.where(moving, self.vel_y + profile.gravity, self.vel_y)
+		np.minimum(y, FLOOR_Y, out=y)
+		ceiling: np.ndarray = y < CEILING_Y
+		y[ceiling] = CEILING_Y
+		vel_y[ceiling] = 0
+
+		alive &= ~hit
+
+		self.y = y
+		self.vel_y = vel_y
+		self.frame += 1
+
+		return int(np.count_nonzero(alive))
+
+	def run(self, controller, max_frames: int = 100_000) -> np.ndarray:
+		# controller(batch) -> bool array of length n, called once per frame
+		while self.frame < max_frames and self.step(controller(self)):
+			pass
+
+		return self.score
+
+	def next_pipe(self):
+		for pipe in self.course.pipes:
+			if pipe.x + self.course.pipe_width > self.bird_x:
+				return pipe
+
+		return None
+
+def batch_gap_controller(batch: BatchSimulation) -> np.ndarray:
+	pipe = batch.next_pipe()
+
+	return gap_flap(batch.y, batch.vel_y, pipe.y if pipe else None, batch.course.gap)
+
+def benchmark(n: int = 10_000, frames: int = 2_000, seed: int = 1) -> None:
+	batch: BatchSimulation = BatchSimulation(n, seed=seed)
+	start: float = time.perf_counter()
+	steps: int = 0
+	while steps < frames:
+		if not batch.step(batch_gap_controller(batch)):
+			batch.reset(seed)
+		steps += 1
+	batch_rate: float = n * frames / (time.perf_counter() - start)
+
+	simulation: Simulation = Simulation(seed=seed)
+	start = time.perf_counter()
+	steps = 0
+	while steps < frames:
+		if not simulation.step(gap_controller(simulation)):
+			simulation.reset(seed)
+		steps += 1
+	single_rate: float = frames / (time.perf_counter() - start)
+
+	print(f"batch: {batch_rate:,.0f} bird-steps/s, single: {single_rate:,.0f} steps/s, speedup: {batch_rate / single_rate:.0f}x")
+
+if __name__ == "__main__":
+	benchmark()
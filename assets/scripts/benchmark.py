@@ -0,0 +1,216 @@
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame as pg
+import argparse
+import platform
+import random
+import json
+import time
+
+from main import FlappyBirdGame
+from simulation import gap_flap
+from states import State
+
+# (label, attribute path from the game, method name), measured around the real calls made by step()/render()
+SUBSYSTEMS: tuple[tuple[str, str | None, str], ...] = (
+	("Background.update", "background", "update"),
+	("Pipes.update", "pipes", "update"),
+	("Bird.update", "flappy_bird", "update"),
+	("InputDispatcher.dispatch", "input", "dispatch"),
+	("CharacterCreator.update", "creator", "update"),
+	("render_background", None, "render_background"),
+	("Pipes.render", "pipes", "render"),
+	("Background.render", "background", "render"),
+	("Bird.render", "flappy_bird", "render"),
+	("Ui.render_main", "ui", "render_main"),
+	("Ui.render_play", "ui", "render_play"),
+	("Ui.render_death", "ui", "render_death"),
+)
+
+def percentile(samples: list[float], fraction: float) -> float:
+	ordered: list[float] = sorted(samples)
+	index: int = min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))
+
+	return ordered[index]
+
+def summarize(samples: list[float]) -> dict[str, float]:
+	if not samples:
+		return {"calls": 0}
+
+	return {
+		"calls": len(samples),
+		"mean_ms": sum(samples) / len(samples) * 1000,
+		"p50_ms": percentile(samples, 0.50) * 1000,
+		"p95_ms": percentile(samples, 0.95) * 1000,
+		"p99_ms": percentile(samples, 0.99) * 1000,
+		"max_ms": max(samples) * 1000,
+	}
+
+class BenchmarkGame(FlappyBirdGame):
+	def __init__(self, frames: int, seed: int, dirty: bool = False, output_height: int = 0) -> None:
+		self.frames: int = frames
+		self.seed: int = seed
+		self.dirty: bool = dirty
+		self.output_height: int = output_height
+		self.samples: dict[str, list[float]] = {label: [] for label, _, _ in SUBSYSTEMS}
+		self.samples["frame"] = []
+		self.samples["present"] = []
+		self.samples["input_latency"] = []
+		self.menu_frames: dict[str, int] = {}
+		super().__init__()
+
+	def init_display(self) -> None:
+		self.render_height = self.output_height
+		super().init_display()
+
+	def instrument(self) -> None:
+		for label, owner_name, method_name in SUBSYSTEMS:
+			owner = self if owner_name is None else getattr(self, owner_name)
+			method = getattr(owner, method_name)
+			samples: list[float] = self.samples[label]
+
+			def timed(*args, method=method, samples=samples, **kwargs):
+				start: float = time.perf_counter()
+				result = method(*args, **kwargs)
+				samples.append(time.perf_counter() - start)
+				return result
+
+			setattr(owner, method_name, timed)
+
+	def post_key(self, key: int) -> None:
+		pg.event.post(pg.event.Event(pg.KEYDOWN, key=key, mod=0, unicode="", scancode=0))
+
+	def post_click(self, position: tuple[int, int]) -> None:
+		# Posted in output pixels like a real click, handle_events maps it back
+		pg.event.post(pg.event.Event(pg.MOUSEBUTTONDOWN, button=1, pos=(round(position[0] * self.render_scale), round(position[1] * self.render_scale))))
+
+	def script_input(self, menu_timer: int) -> None:
+		# Idle on the main menu, play with a simple gap-following bot until its budget runs out, wait on the death menu and click restart
+		bird = self.flappy_bird
+		if self.states.state is State.MAIN and menu_timer >= 60:
+			self.post_key(pg.K_SPACE)
+
+		elif self.states.state is State.PLAY and menu_timer < self.play_budget:
+			pipe = next((pipe for pipe in self.pipes.pipes if pipe.x + pipe.pipe_width > bird.x), None)
+			if gap_flap(bird.y, bird.vel_y, pipe.y if pipe else None, self.pipes.gap, self.aim):
+				self.post_key(pg.K_SPACE)
+
+		elif self.states.state is State.DEATH and menu_timer >= 120:
+			self.post_click(self.ui.restart_button_rect.center)
+
+	def run_game(self) -> None:
+		random.seed(self.seed)
+		# The first course was seeded while the game started up, before the seed above
+		self.pipes.new_run(self.seed)
+		self.record_replays = False
+		self.dirty_rendering = self.dirty
+		self.instrument()
+		self.input.measure_latency = True
+
+		self.running = True
+
+		menu: State = self.states.state
+		menu_timer: int = 0
+		self.aim: float = 0.6
+		self.play_budget: int = 600
+
+		for _ in range(self.frames):
+			start: float = time.perf_counter()
+
+			self.script_input(menu_timer)
+			self.handle_events()
+			self.step()
+			self.render(1)
+
+			present_start: float = time.perf_counter()
+			self.present()
+			end: float = time.perf_counter()
+
+			self.samples["present"].append(end - present_start)
+			self.samples["frame"].append(end - start)
+
+			if self.states.state is not menu:
+				menu = self.states.state
+				menu_timer = 0
+				self.aim = random.uniform(0.45, 0.75)
+				self.play_budget = random.randint(300, 1200)
+
+			menu_timer += 1
+			self.menu_frames[menu.value] = self.menu_frames.get(menu.value, 0) + 1
+
+		# From the poll that picked a scripted click or key press up to the present that showed its effect
+		self.samples["input_latency"].extend(self.input.latencies)
+		self.scores.close()
+		pg.quit()
+
+def run_benchmark(frames: int, seed: int, dirty: bool = False, output_height: int = 0) -> dict:
+	high_score_file: str = "assets/data/high_score.txt"
+	with open(high_score_file, "rb") as file:
+		saved_high_score: bytes = file.read()
+
+	try:
+		game: BenchmarkGame = BenchmarkGame(frames, seed, dirty, output_height)
+
+	finally:
+		with open(high_score_file, "wb") as file:
+			file.write(saved_high_score)
+
+	return {
+		"frames": frames,
+		"seed": seed,
+		"dirty_rendering": dirty,
+		"render_height": output_height,
+		"python": platform.python_version(),
+		"pygame": pg.version.ver,
+		"platform": platform.platform(),
+		"menu_frames": game.menu_frames,
+		"variant_misses": game.assets.variant_misses,
+		"results": {label: summarize(samples) for label, samples in game.samples.items()},
+	}
+
+def compare(current: dict, baseline: dict) -> None:
+	print(f"{'':<26} {'p50 ms':>16} {'p95 ms':>16} {'p99 ms':>16}")
+	for label, stats in current["results"].items():
+		old: dict[str, float] = baseline["results"].get(label, {})
+		cells: list[str] = []
+		for key in ("p50_ms", "p95_ms", "p99_ms"):
+			if key in stats and key in old and old[key] > 0:
+				cells.append(f"{stats[key]:>7.3f} ({(stats[key] / old[key] - 1) * 100:+5.0f}%)")
+
+			else:
+				cells.append(f"{stats.get(key, 0):>16.3f}")
+
+		print(f"{label:<26} {' '.join(cells)}")
+
+def main() -> None:
+	parser: argparse.ArgumentParser = argparse.ArgumentParser(description="Headless frame-time benchmark with a per-subsystem breakdown.")
+	parser.add_argument("--frames", type=int, default=5000)
+	parser.add_argument("--seed", type=int, default=0)
+	parser.add_argument("--output", default="bench_output.json")
+	parser.add_argument("--compare", help="a previous JSON result to compare against")
+	parser.add_argument("--dirty", action="store_true", help="use the dirty-rectangle renderer")
+	parser.add_argument("--render-height", type=int, default=0, help="render natively at this output height instead of 600")
+	args: argparse.Namespace = parser.parse_args()
+
+	result: dict = run_benchmark(args.frames, args.seed, args.dirty, args.render_height)
+
+	with open(args.output, "w") as file:
+		json.dump(result, file, indent=4)
+
+	if args.compare:
+		with open(args.compare, "r") as file:
+			compare(result, json.load(file))
+
+	else:
+		print(f"{'':<26} {'calls':>7} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}")
+		for label, stats in result["results"].items():
+			if stats["calls"]:
+				print(f"{label:<26} {stats['calls']:>7} {stats['p50_ms']:>8.3f} {stats['p95_ms']:>8.3f} {stats['p99_ms']:>8.3f}")
+
+	print(f"frames per menu: {result['menu_frames']}, variants scaled while drawing: {result['variant_misses']}, written to {args.output}")
+
+if __name__ == "__main__":
+	main()
@@ -1,21 +1,24 @@
 import pygame as pg
 import random
-import os
 import time
 
-from cryptography.fernet import Fernet
-from pathlib import Path
-
-pg.mixer.init()
+from simulation import FLOOR_Y, fall, next_angle
+from collision import Collision
+from states import State
 
 class Bird:
 	def __init__(self, game: 'Game', ui: 'Ui') -> None: # type: ignore
 			self.screen_width: int = game.screen_width
 			self.screen_height: int = game.screen_height
 			self.ui: 'Ui' = ui # type: ignore
+			self.assets: 'AssetManager' = game.assets # type: ignore
+			self.catalog: 'SkinCatalog' = game.skin_catalog # type: ignore
+			self.scores: 'ScoreStore' = game.scores # type: ignore
+			self.states: 'StateMachine' = game.states # type: ignore
 
 			self.x: int = 50
 			self.y: int = 250
+			self.prev_y: float = self.y
 
 			self.vel_y: float = 0
 			self.vel_x: float = 4  # 60: 5, 90: 4
@@ -34,11 +37,10 @@ class Bird:
 
 			self.bird_image: pg.Surface | None = None
 
-			self.flap_sound: pg.mixer.Sound = pg.mixer.Sound("assets/sounds/player/sfx_flap.wav")
-			self.death_sound: pg.mixer.Sound = pg.mixer.Sound("assets/sounds/player/sfx_die.wav")
-			self.hit_sound: pg.mixer.Sound = pg.mixer.Sound("assets/sounds/player/sfx_hit.wav")
+			self.sounds: 'SoundBank' = game.sounds # type: ignore
 
 			self.bird_rect: pg.Rect = pg.Rect(self.x, self.y, self.bird_width, self.bird_height)
+			self.collision: Collision = Collision(game.pixel_perfect_collision)
 
 			self.frame: float = 1
 			self.frame_speed: float = 0.25
@@ -46,12 +48,12 @@ class Bird:
 
 			self.distance: int = 0
 
-			self.high_score: int = 0
 			self.score: int = 0
 
 			self.error_timer: int = 250  # 60: 200, 90: 250
 
 			self.dead: bool = False
+			self.flapped: bool = False
 			self.floored: bool = False
 			self.death_sound_played: bool = False
 
@@ -65,44 +67,34 @@ class Bird:
 
 			self.skin_selected: str = "yellow"
 
-			self.key_file: str = "assets/data/encryption_key.key"
-
-			self.menu: str = "main"
-
-			try:
-				with open(self.key_file, "rb") as file:
-					self.key: bytes = file.read()
-
-			except FileNotFoundError:
-				self.key = Fernet.generate_key()
-				with open(self.key_file, "wb") as file:
-					file.write(self.key)
-
-			self.cipher_suite: Fernet = Fernet(self.key)
-   
 			self.file_check()
 
-			self.load_score()
-
 			self.frames_count: int = self.get_frames_count(self.skin_selected)
+			self.rotation_cache: dict[tuple[int, int], tuple[pg.Surface, pg.Mask]] = {}
+			self.build_rotation_cache()
+
+	@property
+	def high_score(self) -> int:
+		return self.scores.high_score
 
 	def file_check(self) -> None:
-		with open("assets/sprites/player/data_stationary.txt", "r") as file:
-			folders_in_data: list[str] = file.readlines()
-			self.skins_stationary: list[str] = [folder.strip() for folder in folders_in_data] + self.stationary
+		frame_paths: list[str] | None = self.catalog.frame_paths.get(self.skin_selected)
+		if self.catalog.dirty:
+			self.catalog.refresh()
+
+		self.skins_stationary: list[str] = self.catalog.stationary + self.stationary
+		self.skins: list[str] = list(self.catalog.names)
 
-		self.skins: list[str] = []
-		for folder in Path("assets/sprites/player").iterdir():
-			if folder.is_dir():
-				files_in_folder: list[str] = os.listdir(folder)
-				if any(file.endswith('.png') for file in files_in_folder):
-					self.skins.append(folder.name)
+		# A deleted skin falls back to the default one, a skin that gained or lost frames is reloaded
+		if self.skin_selected not in self.skins:
+			if self.skins:
+				self.select_skin("yellow" if "yellow" in self.skins else self.skins[0])
+
+		elif self.catalog.frame_paths[self.skin_selected] != frame_paths:
+			self.select_skin(self.skin_selected)
 
 	def get_frames_count(self, skin_selected: str) -> int:
-		directory_path: Path = Path(f"assets/sprites/player/{skin_selected}")
-		folder_length: int = len([item for item in directory_path.iterdir() if item.is_file()])
-  
-		return folder_length
+		return self.catalog.frames_count(skin_selected)
 
 	def handle_mode(self) -> None:
 		match self.mode:
@@ -116,64 +108,108 @@ class Bird:
 				self.vel_x = 2
 				self.vel_y = 20
 
-	def update(self, screen: pg.Surface, events: list[pg.event.Event], pipes: 'Pipes', volume: float) -> None: # type: ignore
+	def update(self, pipes: 'Pipes') -> None: # type: ignore
+		self.prev_y = self.y
 		self.bird_rect.topleft = (self.x + 15, self.y + 10)
 		#pg.draw.rect(screen, (255, 0, 0), self.bird_rect, 2)
 
+		# The store reports a corrupt file once it finishes loading in the background
+		if self.scores.decryption_error:
+			self.scores.decryption_error = False
+			self.decryption_error = True
+
 		if self.decryption_error:
 			self.error_timer -= 1
 			if self.error_timer < 1:
 				self.decryption_error = False
 
-		if self.score > self.high_score:
-			self.high_score = self.score
-			self.save_score()
-
-		if self.menu == "main":
-			self.idle_play()
-
-		if self.menu in {"main", "death", "play"}:
-			if not self.dead:
-				self.animate()
-				self.check_collision(pipes)
-				self.death_sound_played = False
-
-			self.update_angle()
-			self.update_position()
-			#self.handle_mode()
-			self.handle_events(events)
-			self.render(screen)
-			self.append_achievements()
-			self.set_volume(volume)
+		self.scores.submit(self.score)
+
+		if not self.dead:
+			self.animate()
+			self.check_collision(pipes)
+			self.death_sound_played = False
+
+		self.update_angle()
+		self.update_position()
+		#self.handle_mode()
+		self.append_achievements()
+		if self.catalog.dirty:
 			self.file_check()
    
-	def render(self, screen: pg.Surface) -> None:
+	def select_skin(self, skin: str) -> None:
+		self.skin_selected = skin
+		self.frames_count = self.get_frames_count(self.skin_selected)
+		self.frame = 1
+		self.build_rotation_cache()
+
+	def rotation_angles(self, stationary: bool | None = None) -> list[int]:
+		if stationary is None:
+			stationary = self.skin_selected in self.skins_stationary
+
+		if stationary:
+			return [0]
+
+		step: int = max(1, int(self.angle_acceleration))
+		angles: set[int] = set(range(int(self.min_angle), int(self.max_angle) + 1, step))
+		angles.update((0, int(self.max_angle)))
+
+		return sorted(angles)
+
+	def rotate_frame(self, image: pg.Surface, angle: int) -> pg.Surface:
+		if not angle == 0: # Allows for an anti-aliasing effect when the image is rotating, and stops when its not(basically makes jagged edges less obvious).
+			return pg.transform.rotozoom(image, angle, 1)
+
+		return pg.transform.rotate(image, angle)
+
+	def build_rotation_cache(self) -> None:
 		try:
-			if self.get_frames_count(self.skin_selected) > 1:
-				self.bird_image = pg.image.load(f"assets/sprites/player/{self.skin_selected}/{self.skin_selected}{int(self.frame)}.png").convert_alpha()
+			frames: list[pg.Surface] = self.assets.skin_frames(self.skin_selected, self.catalog.frame_paths[self.skin_selected])
+
+		except Exception:
+			self.rotation_cache = {}
+			return
+
+		cache: dict[tuple[int, int], tuple[pg.Surface, pg.Mask]] | None = self.assets.rotations.get(self.skin_selected)
+		if cache is None:
+			cache = {}
+			self.assets.rotations[self.skin_selected] = cache
+
+		for frame_index, image in enumerate(frames):
+			for angle in self.rotation_angles():
+				if (frame_index, angle) not in cache:
+					rotated: pg.Surface = self.rotate_frame(image, angle)
+					cache[(frame_index, angle)] = (rotated, pg.mask.from_surface(rotated))
+					self.assets.prescale(rotated)
 
-			else:
-				self.bird_image = pg.image.load(f"assets/sprites/player/{self.skin_selected}/{self.skin_selected}.png").convert_alpha()
+		self.rotation_cache = cache
 
-			self.bird_mask = pg.mask.from_surface(self.bird_image)
+	def render(self, screen: pg.Surface, alpha: float = 1) -> None:
+		# alpha is how far rendering is between the last two simulation steps
+		y: float = self.prev_y + (self.y - self.prev_y) * alpha
 
-			if not self.angle == 0: # Allows for an anti-aliasing effect when the image is rotating, and stops when its not(basically makes jagged edges less obvious).
-				rotated_bird = pg.transform.rotozoom(self.bird_image, self.angle, 1)
+		try:
+			frame_index: int = int(self.frame) - 1
+			key: tuple[int, int] = (frame_index, round(self.angle))
 
-			else:
-				rotated_bird =	pg.transform.rotate(self.bird_image, self.angle)
+			rotated: tuple[pg.Surface, pg.Mask] | None = self.rotation_cache.get(key)
+			if rotated is None:
+				self.bird_image = self.assets.skin_frames(self.skin_selected, self.catalog.frame_paths[self.skin_selected])[frame_index]
+				rotated_bird: pg.Surface = self.rotate_frame(self.bird_image, key[1])
+				rotated = (rotated_bird, pg.mask.from_surface(rotated_bird))
+				self.rotation_cache[key] = rotated
+				self.assets.prescale(rotated_bird)
 
-			rotated_rect = rotated_bird.get_rect(center=(int(self.x + 40), int(self.y + 35)))
+			rotated_bird = rotated[0]
+			rotated_rect = rotated_bird.get_rect(center=(int(self.x + 40), int(y + 35)))
 
 			screen.blit(rotated_bird, rotated_rect.topleft)
 
 		except Exception as e:
 			if self.skins:
 				print("Error: frame error")
-				self.skin_selected = random.choice(self.skins)
-				self.frame = 1
-				self.frames_count = self.get_frames_count(self.skin_selected)
-				self.render(screen)
+				self.select_skin(random.choice(self.skins))
+				self.render(screen, alpha)
 				return
 
 	def animate(self) -> None:
@@ -188,6 +224,7 @@ class Bird:
 
 	def restart(self) -> None:
 		self.y = 250
+		self.prev_y = self.y
 
 		self.restart_timer: int = 100
 		self.idle_timer: int = 25  # 60: 20, 90: 25
@@ -201,117 +238,86 @@ class Bird:
 		self.score = 0
 
 		self.dead = False
-		self.menu = "main"
-
-	def set_volume(self, volume: float) -> None:
-		self.flap_sound.set_volume(volume)
-		self.death_sound.set_volume(volume)
-		self.hit_sound.set_volume(volume)
-  
-	def handle_events(self, events: list[pg.event.Event]) -> None:
-		for event in events:
-			if event.type == pg.MOUSEBUTTONDOWN:
-				if event.button == 1:
-					if self.menu == "main" and not self.ui.volume_button_rect.collidepoint(event.pos):
-						self.menu = "play"
-						self.flap()
-
-					elif self.menu == "play":
-						self.flap()
-
-			elif event.type == pg.KEYDOWN:
-				if event.key == pg.K_SPACE:
-					if self.menu in {"main", "play"}:
-						self.menu = "play"
-						self.flap()
-
-				elif self.menu == "main":
-					if event.key == pg.K_c:
-						self.menu = "creator"
-
-					if event.key == pg.K_x:
-						self.menu = "delete"
-
-					if event.key == pg.K_LEFT:
-						current_index: int = self.skins.index(self.skin_selected)
-						new_index: int = (current_index - 1) % len(self.skins)
-						self.skin_selected = self.skins[new_index]
-						self.frames_count = self.get_frames_count(self.skin_selected)
-						self.frame = 1
-
-					elif event.key == pg.K_RIGHT:
-						current_index = self.skins.index(self.skin_selected)
-						new_index = (current_index + 1) % len(self.skins)
-						self.skin_selected = self.skins[new_index]
-						self.frames_count = self.get_frames_count(self.skin_selected)
-						self.frame = 1
+		self.states.change(State.MAIN)
+
+	def on_click(self, event: pg.event.Event) -> bool:
+		if event.button != 1:
+			return False
+
+		self.states.change(State.PLAY)
+		self.flap()
+
+		return True
+
+	def on_key(self, event: pg.event.Event) -> bool:
+		if event.key == pg.K_SPACE:
+			self.states.change(State.PLAY)
+			self.flap()
+
+			return True
+
+		if self.states.state is not State.MAIN:
+			return False
+
+		if event.key == pg.K_c:
+			self.states.change(State.CREATOR)
+
+		elif event.key == pg.K_x:
+			self.states.change(State.DELETE)
+
+		elif event.key == pg.K_LEFT:
+			current_index: int = self.skins.index(self.skin_selected)
+			new_index: int = (current_index - 1) % len(self.skins)
+			self.select_skin(self.skins[new_index])
+
+		elif event.key == pg.K_RIGHT:
+			current_index = self.skins.index(self.skin_selected)
+			new_index = (current_index + 1) % len(self.skins)
+			self.select_skin(self.skins[new_index])
+
+		else:
+			return False
+
+		return True
 
 	def flap(self) -> None:
 		self.vel_y = self.jump_strength
-		self.flap_sound.play()
+		self.flapped = True
+		self.sounds.play("flap")
 
 	def update_position(self) -> None:
-		self.y += self.vel_y
-		self.vel_y += self.gravity
+		self.y, self.vel_y = fall(self.y, self.vel_y, self.gravity)
 
 		if not self.dead:
 			self.distance += self.vel_x
 
 		if self.dead and self.vel_y > 7 and not self.death_sound_played and not self.y >= 500:
-			self.death_sound.play()
+			self.sounds.play("die")
 			self.death_sound_played = True
 
-		if self.y >= 510 or self.y < 0:
-			self.y = min(self.y, 510)
-
-		if self.y < -35:
-			self.y = -35
-			self.vel_y = 0
-
 	def update_angle(self) -> None:
 		if self.skin_selected in self.skins_stationary:
 			self.angle = 0
 
 		else:
-			if self.vel_y < 0 and self.angle < self.max_angle:
-				self.angle = self.max_angle
+			self.angle = next_angle(self.angle, self.vel_y, self.max_angle, self.min_angle, self.angle_acceleration)
 
-			elif self.vel_y >= 0 and self.angle > self.min_angle:
-				self.angle -= self.angle_acceleration
+	def current_mask(self) -> tuple[pg.Mask | None, tuple[int, int] | None]:
+		rotated: tuple[pg.Surface, pg.Mask] | None = self.rotation_cache.get((int(self.frame) - 1, round(self.angle)))
+		if rotated is None:
+			return None, None
 
-	def check_collision(self, pipes: 'Pipes') -> None: # type: ignore
-		for pipe in pipes.pipes:
-			upper_pipe_rect: pg.Rect = pg.Rect(pipe.x, 0, pipe.pipe_width, pipe.y)
-			lower_pipe_rect: pg.Rect = pg.Rect(pipe.x, pipe.y + pipe.gap, pipe.pipe_width, pipe.screen_height - pipe.y - pipe.gap)
+		width, height = rotated[1].get_size()
 
-			if self.bird_rect.colliderect(upper_pipe_rect) or self.bird_rect.colliderect(lower_pipe_rect):
-				self.death()
+		return rotated[1], (int(self.x + 40) - width // 2, int(self.y + 35) - height // 2)
 
-		if self.y >= 510:
+	def check_collision(self, pipes: 'Pipes') -> None: # type: ignore
+		bird_mask, bird_topleft = self.current_mask() if self.collision.pixel_perfect else (None, None)
+		if self.collision.check(self.bird_rect, pipes.pipes, bird_mask, bird_topleft):
 			self.death()
 
-	def save_score(self, filename: str = "assets/data/high_score.txt") -> None:
-		encrypted_score: bytes = self.cipher_suite.encrypt(str(self.high_score).encode())
-		with open(filename, "wb") as file:
-			file.write(encrypted_score)
-
-#this is shit, do it somewhere else!!!!
-	def load_score(self, filename: str = "assets/data/high_score.txt") -> None:
-		try:
-			with open(filename, "rb") as file:
-				encrypted_score: bytes = file.read()
-				try:
-					decrypted_score: str = self.cipher_suite.decrypt(encrypted_score).decode()
-					self.high_score = int(decrypted_score)
-					self.decryption_error = False
-
-				except Exception:
-					self.decryption_error = True
-					self.save_score()
-
-		except (FileNotFoundError, ValueError):
-			self.high_score = 0
-			self.save_score()
+		if self.y >= FLOOR_Y:
+			self.death()
 
 	def idle_play(self) -> None:
 		if self.y >= 330:
@@ -332,5 +338,6 @@ class Bird:
 	def death(self) -> None:
 		self.vel_y = 0
 		self.dead = True
-		self.menu = "death"
-		self.hit_sound.play()
+		self.states.change(State.DEATH)
+		self.scores.flush()
+		self.sounds.play("hit")
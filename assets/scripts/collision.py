@@ -0,0 +1,46 @@
+import pygame as pg
+
+class Collision:
+	def __init__(self, pixel_perfect: bool = False) -> None:
+		# Rect hitboxes by default, pixel_perfect adds a mask test once the rects overlap
+		self.pixel_perfect: bool = pixel_perfect
+		self.pipe_masks: dict[int, pg.Mask] = {}
+
+	def pipe_mask(self, pipe: 'Pipe', upper: bool) -> pg.Mask: # type: ignore
+		# Pipe columns are shared per theme and height, so their masks are too
+		image: pg.Surface = pipe.upper_pipe_image if upper else pipe.lower_pipe_image
+		key: int = id(image)
+
+		mask: pg.Mask | None = self.pipe_masks.get(key)
+		if mask is None:
+			mask = pg.mask.from_surface(image)
+			self.pipe_masks[key] = mask
+
+		return mask
+
+	def masks_overlap(self, bird_mask: pg.Mask, bird_topleft: tuple[int, int], pipe: 'Pipe') -> bool: # type: ignore
+		for upper, rect in ((True, pipe.upper_pipe_rect), (False, pipe.lower_pipe_rect)):
+			if rect.height > 0 and self.pipe_mask(pipe, upper).overlap(bird_mask, (bird_topleft[0] - rect.x, bird_topleft[1] - rect.y)):
+				return True
+
+		return False
+
+	def check(self, bird_rect: pg.Rect, pipes: 'Deque[Pipe]', bird_mask: pg.Mask | None = None, bird_topleft: tuple[int, int] | None = None) -> bool: # type: ignore
+		# Pipes are ordered by x, so only the ones overlapping the bird's x-range are tested and the scan stops at the first pipe ahead of it
+		left: int = bird_rect.left
+		right: int = bird_rect.right
+		for pipe in pipes:
+			if pipe.x >= right:
+				break
+
+			if pipe.x + pipe.pipe_width <= left:
+				continue
+
+			if bird_rect.colliderect(pipe.upper_pipe_rect) or bird_rect.colliderect(pipe.lower_pipe_rect):
+				if not self.pixel_perfect or bird_mask is None:
+					return True
+
+				if self.masks_overlap(bird_mask, bird_topleft, pipe):
+					return True
+
+		return False
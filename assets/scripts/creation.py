@@ -1,24 +1,40 @@
-import tkinter.messagebox as messagebox
-import tkinter as tk
 import shutil
 import os
 import re
 
-from tkinter import filedialog
-from pathlib import Path
+from skin_import import SkinImport
+from states import State
+
+# tkinter is only imported once the creator is opened, most sessions never need it
+tk = None
+messagebox = None
+filedialog = None
+
+def load_tkinter() -> None:
+    global tk, messagebox, filedialog
+    if tk is None:
+        import tkinter
+        import tkinter.messagebox
+        import tkinter.filedialog
+
+        tk, messagebox, filedialog = tkinter, tkinter.messagebox, tkinter.filedialog
 
 class CharacterCreator:
     def __init__(self, flappy_bird: 'FlappyBird') -> None: # type: ignore
         self.flappy_bird: 'FlappyBird' = flappy_bird # type: ignore
         self.imported_files: dict[str, list[str]] = {}
+        self.job: SkinImport | None = None
 
     def update(self) -> None:
-        if self.flappy_bird.menu == "creator":
-            self.show_import_rules()
-            self.select_import()
+        if self.job is not None and self.job.collect(self.flappy_bird.assets):
+            self.finish_import()
 
-        if self.flappy_bird.menu == "delete":
-            self.select_delete()
+    def import_menu(self) -> None:
+        self.show_import_rules()
+        self.select_import()
+
+    def delete_menu(self) -> None:
+        self.select_delete()
 
     def show_import_rules(self) -> None:
         import_text = (
@@ -42,18 +58,25 @@ class CharacterCreator:
 
     def select_import(self) -> None:
         self.imported_files = {}
+        if self.job is not None:
+            messagebox.showinfo("Character Creator", "A skin is still being imported, please wait for it to finish.")
+            self.flappy_bird.states.change(State.MAIN)
+            return
+
         root = tk.Tk()
         root.withdraw()
         file_paths = filedialog.askopenfilenames()
         if not file_paths:
-            self.flappy_bird.menu = "main"
+            self.flappy_bird.states.change(State.MAIN)
             return
 
+        # Only the cheap checks run here, decoding and saving the frames happens on the import job
+        destinations: dict[str, list[tuple[str, str]]] = {}
         if len(file_paths) == 1:
             file_path = file_paths[0]
             if not file_path.lower().endswith('.png'):
                 messagebox.showerror("Error", f"File '{file_path}' is not a PNG file. Only PNG files are allowed.")
-                self.flappy_bird.menu = "main"
+                self.flappy_bird.states.change(State.MAIN)
                 return
 
             file_name = os.path.splitext(os.path.basename(file_path))[0]
@@ -63,16 +86,12 @@ class CharacterCreator:
             self.imported_files[folder_name] = [file_path]
 
             self.destination_folder = os.path.join("assets", "sprites", "player", folder_name)
-            if not os.path.exists(self.destination_folder):
-                os.makedirs(self.destination_folder)
-                
-            else:
+            if os.path.exists(self.destination_folder):
                 messagebox.showerror("Error", f"Folder '{folder_name}' already exists. Please choose another name.")
-                self.flappy_bird.menu = "main"
+                self.flappy_bird.states.change(State.MAIN)
                 return
 
-            destination_path = os.path.join(self.destination_folder, new_file_name)
-            shutil.copy(file_path, destination_path)
+            destinations[folder_name] = [(file_path, new_file_name)]
             
         else:
             for file_path in file_paths:
@@ -114,23 +133,35 @@ class CharacterCreator:
                     return
 
                 self.destination_folder = os.path.join("assets", "sprites", "player", folder_name)
-                if not os.path.exists(self.destination_folder):
-                    os.makedirs(self.destination_folder)
-                    
-                else:
+                if os.path.exists(self.destination_folder):
                     messagebox.showerror("Error", f"Folder '{folder_name}' already exists. Please choose another name.")
                     self.imported_files.clear()
                     return
 
-                for file in files:
-                    destination_path = os.path.join(self.destination_folder, os.path.basename(file))
-                    shutil.copy(file, destination_path)
+                ordered = sorted(files, key=lambda file: int(re.search(r'\d+', os.path.splitext(os.path.basename(file))[0]).group()))
+                destinations[folder_name] = [(file, os.path.basename(file)) for file in ordered]
 
         if len(self.imported_files) == 1:
             self.choose_sprite_type()
-            
-        self.flappy_bird.skins = [folder.name for folder in Path("assets/sprites/player").iterdir() if folder.is_dir()]
-        self.flappy_bird.menu = "main"
+
+        stationary = set(self.flappy_bird.catalog.read_stationary())
+        angles = {folder_name: self.flappy_bird.rotation_angles(folder_name in stationary) for folder_name in destinations}
+        self.job = SkinImport(destinations, angles, self.flappy_bird.rotate_frame, (self.flappy_bird.bird_width, self.flappy_bird.bird_height))
+        self.job.start()
+        self.flappy_bird.states.change(State.MAIN)
+
+    def finish_import(self) -> None:
+        if self.job.error is not None:
+            messagebox.showerror("Error", f"Importing the skin failed: {self.job.error}")
+
+        self.job = None
+        self.flappy_bird.catalog.mark_dirty()
+        self.flappy_bird.file_check()
+
+    def render(self, screen, alpha: float = 1) -> None:
+        if self.job is not None:
+            text = f"Importing skin {round(self.job.progress * 100)}%"
+            self.flappy_bird.ui.text_cache.blit(screen, text, (255, 255, 255), (0, 0, 0), (screen.get_width() // 2, screen.get_height() - 30))
 
     def choose_sprite_type(self) -> None:
         with open("assets/sprites/player/data_stationary.txt", "a") as file:
@@ -158,7 +189,7 @@ class CharacterCreator:
         
         file_paths = filedialog.askopenfilenames(initialdir="assets/sprites/player")
         if not file_paths:
-            self.flappy_bird.menu = "main"
+            self.flappy_bird.states.change(State.MAIN)
             return
 
         for file_path in file_paths:
@@ -176,6 +207,8 @@ class CharacterCreator:
             if not confirm:
                 continue
 
+            skin_name = os.path.basename(os.path.normpath(file_path if os.path.isdir(file_path) else os.path.dirname(file_path)))
+
             if os.path.isfile(file_path) and file_path.lower().endswith('.png'):
                 folder_path = os.path.dirname(file_path)
                 if self.deletion_breaks_sequence(folder_path, file_path):
@@ -196,9 +229,11 @@ class CharacterCreator:
                 messagebox.showwarning("Warning", f"File '{file_path}' is not a PNG file and won't be deleted.")
 
             self.rename_file_if_necessary(os.path.dirname(file_path))
+            self.flappy_bird.assets.evict_skin(skin_name)
 
-        self.flappy_bird.skins = [folder.name for folder in Path("assets/sprites/player").iterdir() if folder.is_dir()]
-        self.flappy_bird.menu = "main"
+        self.flappy_bird.catalog.mark_dirty()
+        self.flappy_bird.file_check()
+        self.flappy_bird.states.change(State.MAIN)
 
     def deletion_breaks_sequence(self, folder_path: str, file_to_delete: str) -> bool:
         file_to_delete_name = os.path.basename(file_to_delete)
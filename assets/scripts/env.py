@@ -0,0 +1,154 @@
+import numpy as np
+import argparse
+import time
+
+from simulation import PROFILES, PhysicsProfile, Simulation, gap_flap
+
+class FlappyBirdEnv:
+	# Gym-style wrapper around Simulation: the game's rules and pipe course without the window, sound or menus
+	observation_size: int = 6 # bird y, vel_y, then distance to and gap centre of the next two pipes
+	action_count: int = 2 # 0: do nothing, 1: flap
+
+	def __init__(self, profile: PhysicsProfile | str = "normal", frame_skip: int = 1, max_steps: int | None = None, render_mode: str | None = None, pass_reward: float = 1.0, alive_reward: float = 0.01, death_reward: float = -1.0) -> None:
+		if render_mode not in {None, "human", "rgb_array"}:
+			raise ValueError(f"unsupported render mode {render_mode!r}")
+
+		self.simulation: Simulation = Simulation(profile)
+		self.frame_skip: int = max(1, frame_skip) # the action is taken on the first frame, the skipped ones don't flap
+		self.max_steps: int | None = max_steps
+		self.render_mode: str | None = render_mode
+
+		self.pass_reward: float = pass_reward
+		self.alive_reward: float = alive_reward
+		self.death_reward: float = death_reward
+
+		# Filled in place and handed back by every reset and step, copy it to keep one
+		self.observation: np.ndarray = np.zeros(self.observation_size, dtype=np.float32)
+		self.info: dict[str, int] = {"seed": 0, "score": 0, "frame": 0}
+		self.steps: int = 0
+
+		# Only created once something is rendered, training never imports pygame
+		self.view: 'SimulationView | None' = None # type: ignore
+
+	def reset(self, seed: int | None = None) -> tuple[np.ndarray, dict[str, int]]:
+		self.simulation.reset(seed)
+		self.steps = 0
+		self.info["seed"] = self.simulation.seed
+
+		if self.render_mode == "human":
+			self.render()
+
+		return self.observe(), self.update_info()
+
+	def step(self, action: int) -> tuple[np.ndarray, float, bool, bool, dict[str, int]]:
+		simulation: Simulation = self.simulation
+		score: int = simulation.bird.score
+
+		alive: bool = simulation.step(action == 1)
+		for _ in range(self.frame_skip - 1):
+			if not alive:
+				break
+
+			alive = simulation.step(False)
+
+		self.steps += 1
+		reward: float = (simulation.bird.score - score) * self.pass_reward + (self.alive_reward if alive else self.death_reward)
+		truncated: bool = alive and self.max_steps is not None and self.steps >= self.max_steps
+
+		if self.render_mode == "human":
+			self.render()
+
+		return self.observe(), reward, not alive, truncated, self.update_info()
+
+	def observe(self) -> np.ndarray:
+		simulation: Simulation = self.simulation
+		bird = simulation.bird
+		observation: np.ndarray = self.observation
+
+		observation[0] = bird.y
+		observation[1] = bird.vel_y
+
+		index: int = 2
+		for pipe in simulation.course.pipes:
+			if pipe.x + simulation.pipe_width > bird.x:
+				observation[index] = pipe.x - bird.x
+				observation[index + 1] = pipe.y + simulation.gap / 2
+				index += 2
+				if index == self.observation_size:
+					break
+
+		# Pipes that haven't entered the screen yet are read ahead from the course
+		pipe_course = simulation.course
+		obstacle_index: int = pipe_course.next_obstacle
+		while index < self.observation_size:
+			obstacle = pipe_course.course[obstacle_index]
+			observation[index] = obstacle.x - pipe_course.frame * simulation.profile.vel_x - bird.x
+			observation[index + 1] = obstacle.gap_y + simulation.gap / 2
+			obstacle_index += 1
+			index += 2
+
+		return observation
+
+	def update_info(self) -> dict[str, int]:
+		self.info["score"] = self.simulation.bird.score
+		self.info["frame"] = self.simulation.frame
+
+		return self.info
+
+	def render(self) -> np.ndarray | None:
+		if self.render_mode is None:
+			return None
+
+		if self.view is None:
+			from sim_view import SimulationView
+			self.view = SimulationView(self.simulation, "FlappyBird environment", window=self.render_mode == "human")
+
+		screen = self.view.draw()
+		if self.render_mode == "human":
+			self.view.present(self.simulation.profile.fps // self.frame_skip)
+			return None
+
+		import pygame as pg
+		return pg.surfarray.array3d(screen).swapaxes(0, 1)
+
+	def close(self) -> None:
+		if self.view is not None:
+			self.view.close()
+			self.view = None
+
+def gap_policy(observation: np.ndarray, gap: int = 200) -> int:
+	# The observation holds the next gap's centre, the bot aims relative to its top
+	return int(gap_flap(observation[0], observation[1], observation[3] - gap / 2, gap))
+
+def main() -> None:
+	parser: argparse.ArgumentParser = argparse.ArgumentParser(description="Run a simple policy through the environment and time its steps.")
+	parser.add_argument("--episodes", type=int, default=20)
+	parser.add_argument("--first-seed", type=int, default=0)
+	parser.add_argument("--profile", default="normal", choices=list(PROFILES))
+	parser.add_argument("--frame-skip", type=int, default=1)
+	parser.add_argument("--max-steps", type=int, default=20_000)
+	parser.add_argument("--render", action="store_true", help="watch the episodes in a window")
+	args: argparse.Namespace = parser.parse_args()
+
+	env: FlappyBirdEnv = FlappyBirdEnv(args.profile, args.frame_skip, args.max_steps, "human" if args.render else None)
+	steps: int = 0
+	scores: list[int] = []
+
+	start: float = time.perf_counter()
+	for seed in range(args.first_seed, args.first_seed + args.episodes):
+		observation, info = env.reset(seed)
+		done: bool = False
+		while not done:
+			observation, reward, terminated, truncated, info = env.step(gap_policy(observation))
+			done = terminated or truncated
+			steps += 1
+
+		scores.append(info["score"])
+
+	elapsed: float = time.perf_counter() - start
+	env.close()
+
+	print(f"{args.episodes} episodes, mean score {sum(scores) / len(scores):.2f}, {steps} steps at {elapsed / steps * 1_000_000:.1f} us per step")
+
+if __name__ == "__main__":
+	main()
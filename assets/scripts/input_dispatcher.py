@@ -0,0 +1,84 @@
+import pygame as pg
+import time
+
+from typing import Callable
+from states import State
+
+# A handler returns True once it used the event, the ones after it in the list are skipped
+Handler = Callable[[pg.event.Event], bool | None]
+
+class InputDispatcher:
+	# Polls once per frame and routes every event once, through handler lists keyed by event type and state
+	def __init__(self, states: 'StateMachine') -> None: # type: ignore
+		self.states: 'StateMachine' = states # type: ignore
+
+		# Handlers without a state run as soon as the event is polled (quitting, window and debug keys), the rest wait for the next simulation step
+		self.global_handlers: dict[int, list[Handler]] = {}
+		self.handlers: dict[tuple[int, State], list[Handler]] = {}
+		self.step_types: set[int] = set()
+
+		# Events with the time they were polled at, waiting for the next step
+		self.pending: list[tuple[pg.event.Event, float]] = []
+		self.map_event: Callable[[pg.event.Event], pg.event.Event] | None = None
+
+		self.measure_latency: bool = False
+		self.handled: list[float] = []
+		self.latencies: list[float] = []
+
+	def add(self, event_type: int, handler: Handler, *states: State) -> None:
+		if not states:
+			self.global_handlers.setdefault(event_type, []).append(handler)
+			return
+
+		for state in states:
+			self.handlers.setdefault((event_type, state), []).append(handler)
+
+		self.step_types.add(event_type)
+
+	def poll(self) -> None:
+		events: list[pg.event.Event] = pg.event.get()
+		polled: float = time.perf_counter()
+
+		for event in events:
+			if self.map_event is not None and hasattr(event, "pos"):
+				event = self.map_event(event)
+
+			for handler in self.global_handlers.get(event.type, ()):
+				if handler(event):
+					break
+
+			if event.type in self.step_types:
+				self.pending.append((event, polled))
+
+	def dispatch(self) -> None:
+		# Runs before the step's physics, so a flap already moves the bird on the step that handles it
+		if not self.pending:
+			return
+
+		pending: list[tuple[pg.event.Event, float]] = self.pending
+		self.pending = []
+		for event, polled in pending:
+			# Looked up per event, a click that starts the game lets the next event see the play state
+			for handler in self.handlers.get((event.type, self.states.state), ()):
+				if handler(event):
+					if self.measure_latency:
+						self.handled.append(polled)
+
+					break
+
+	def presented(self) -> None:
+		# Called right after the frame is shown, every input handled since the last one is on screen now
+		if self.handled:
+			now: float = time.perf_counter()
+			self.latencies.extend(now - polled for polled in self.handled)
+			self.handled.clear()
+
+	def latency_report(self) -> str:
+		if not self.latencies:
+			return "Input to present latency: no input handled"
+
+		ordered: list[float] = sorted(self.latencies)
+		median: float = ordered[len(ordered) // 2] * 1000
+		worst: float = ordered[-1] * 1000
+
+		return f"Input to present latency over {len(ordered)} inputs: median {median:.1f} ms, worst {worst:.1f} ms"
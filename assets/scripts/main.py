@@ -2,12 +2,23 @@
 import random
 import pygame as pg
 import logging
+import time
 
-from background import Background
+from background import Background, Scroll
 from bird import Bird
 from pipe import Pipes
 from ui import Ui
-from creation import CharacterCreator
+from creation import CharacterCreator, load_tkinter
+from asset_manager import AssetManager, BUILTIN_SKINS, preload_manifest
+from skin_catalog import SkinCatalog
+from score_store import ScoreStore
+from sound_bank import SoundBank
+from simulation import PhysicsProfile
+from replay import ReplayRecorder
+from profiler import Profiler, CsvSink
+from renderer import DirtyRenderer, ScaledSurface
+from states import State, StateMachine
+from input_dispatcher import InputDispatcher
 
 logging.basicConfig(level=logging.INFO, format='%(message)s')
 
@@ -15,96 +26,325 @@ class FlappyBirdGame:
 	def __init__(self) -> None:
 		pg.init()
   
-		self.fps: int = 90 # default: 90
+		self.fps: int = 90 # default: 90, simulation steps per second, every physics constant is tuned for it
+		self.render_fps: int = 90 # 0: uncapped, otherwise 60/144/240... rendering is interpolated between steps
+		self.step_time: float = 1 / self.fps
+		self.max_frame_time: float = 0.25 # a longer hitch is dropped instead of replayed step by step
 		self.version: str = "1.1.5"
   
 		self.screen_width: int = 800 
 		self.screen_height: int = 600
+		self.render_height: int = 0 # 0: draws at 800x600 and SDL scales every present, otherwise e.g. 1440/2160 draws natively at that height
   
-		icon: pg.Surface = pg.image.load("assets/sprites/player/yellow/yellow1.png")
-
-		self.screen: pg.Surface = pg.display.set_mode((self.screen_width, self.screen_height), pg.DOUBLEBUF | pg.SCALED | pg.RESIZABLE)
-
-		pg.display.set_caption("FlappyBird " + self.version)
-		pg.display.set_icon(icon)
+		self.init_display()
 
 		self.clock: pg.time.Clock = pg.time.Clock()
 		self.font: pg.font.Font = pg.font.Font("assets/sprites/font/flappy_bird.ttf", 36) # size: 36
+		self.scaled_font: pg.font.Font | None = pg.font.Font("assets/sprites/font/flappy_bird.ttf", round(36 * self.render_scale)) if self.render_scale != 1 else None
   
 		self.time_of_day: tuple[str, str, str] = ("day", "night", "impossible")
 
+		self.assets: AssetManager = AssetManager()
+		self.assets.set_scale(self.render_scale)
+		self.scaled_screen: ScaledSurface | None = ScaledSurface(self.screen, self.assets, (self.screen_width, self.screen_height)) if self.render_scale != 1 else None
+
+		self.watch_skins: bool = False # rescans the skins folder when it changes outside the character creator
+		self.skin_catalog: SkinCatalog = SkinCatalog()
+		if self.watch_skins:
+			self.skin_catalog.start_watcher()
+
+		# Images decode on a background thread while the rest starts up behind a loading screen
+		self.assets.preload(preload_manifest(), {skin: paths for skin, paths in self.skin_catalog.frame_paths.items() if skin in BUILTIN_SKINS})
+		self.render_loading()
+
+		self.scores: ScoreStore = ScoreStore()
+		self.sounds: SoundBank = SoundBank()
+		self.sounds.set_volume(1.0)
+
+		self.pixel_perfect_collision: bool = False # mask test after the hitboxes overlap, runs recorded this way can't be replayed
+		self.record_replays: bool = not self.pixel_perfect_collision
+		self.recorder: ReplayRecorder = ReplayRecorder()
+
+		self.dirty_rendering: bool = False # only redraws and presents the areas that changed, for software-rendered displays
+		self.renderer: DirtyRenderer = DirtyRenderer(self.screen)
+
+		self.measure_input_latency: bool = False # logs how long handled clicks and key presses take to reach the screen on exit
+
+		self.wait_for_assets()
+		self.states: StateMachine = StateMachine()
 		self.init_game_objects()
+		self.prepare_variants()
 		self.init_background()
+		self.init_states()
+		self.init_input()
+		self.init_profiler()
 		self.run_game()
 
+	def init_display(self) -> None:
+		icon: pg.Surface = pg.image.load("assets/sprites/player/yellow/yellow1.png")
+
+		if self.render_height:
+			# Everything is drawn at the output size from pre-scaled assets, so presenting never rescales the frame
+			self.render_scale: float = self.render_height / self.screen_height
+			self.screen: pg.Surface = pg.display.set_mode((round(self.screen_width * self.render_scale), self.render_height), pg.DOUBLEBUF)
+
+		else:
+			self.render_scale = 1
+			self.screen = pg.display.set_mode((self.screen_width, self.screen_height), pg.DOUBLEBUF | pg.SCALED | pg.RESIZABLE)
+
+		pg.display.set_caption("FlappyBird " + self.version)
+		pg.display.set_icon(icon)
+
+	def render_loading(self) -> None:
+		self.screen.fill((0, 0, 0))
+		center: tuple[int, int] = self.screen.get_rect().center
+		text: pg.Surface = self.font.render("Loading", True, (255, 255, 255))
+		self.screen.blit(text, text.get_rect(center=(center[0], center[1] - 30)))
+
+		bar: pg.Rect = pg.Rect(0, 0, 300, 12)
+		bar.center = (center[0], center[1] + 20)
+		pg.draw.rect(self.screen, (255, 255, 255), bar, 1)
+		pg.draw.rect(self.screen, (255, 255, 255), (bar.x, bar.y, round(bar.width * self.assets.progress), bar.height))
+
+		pg.display.flip()
+
+	def wait_for_assets(self) -> None:
+		while not self.assets.collect():
+			pg.event.pump()
+			self.render_loading()
+			self.clock.tick(60)
+
 	def init_game_objects(self) -> None:
 		self.ui: Ui = Ui(self, flappy_bird=None)
 		self.flappy_bird: Bird = Bird(self, self.ui)
 		self.ui.flappy_bird = self.flappy_bird
+		self.scroll: Scroll = Scroll()
 		self.pipes: Pipes = Pipes(self, self.flappy_bird)
 		self.background: Background = Background(self, self.flappy_bird)
 		self.creator: CharacterCreator = CharacterCreator(self.flappy_bird)
 
+	def init_states(self) -> None:
+		# Each state only runs and draws the systems listed for it, in this order
+		states: StateMachine = self.states
+		bird: Bird = self.flappy_bird
+
+		states.add_update(self.background, "update", State.MAIN, State.PLAY, State.DEATH)
+		states.add_update(self.pipes, "update", State.PLAY)
+		states.add_update(self.pipes, "freeze", State.DEATH)
+		states.add_update(bird, "idle_play", State.MAIN)
+		states.add_update(self, "update_bird", State.MAIN, State.PLAY, State.DEATH)
+		states.add_update(self.ui, "animate_start", State.MAIN)
+		states.add_update(self.creator, "update", State.MAIN, State.PLAY, State.DEATH, State.CREATOR, State.DELETE)
+		states.add_update(self.creator, "import_menu", State.CREATOR)
+		states.add_update(self.creator, "delete_menu", State.DELETE)
+
+		states.add_render(self.pipes, "render", State.PLAY, State.DEATH)
+		states.add_render(self.background, "render", *State)
+		states.add_render(bird, "render", State.MAIN, State.PLAY, State.DEATH)
+		states.add_render(self.ui, "render_main", State.MAIN)
+		states.add_render(self.ui, "render_play", State.PLAY)
+		states.add_render(self.ui, "render_death", State.DEATH)
+		states.add_render(self.creator, "render", *State)
+
+		states.on_enter(self.pipes.reset, State.MAIN)
+		states.on_enter(self.scroll.hold, State.CREATOR, State.DELETE)
+		states.on_enter(load_tkinter, State.CREATOR, State.DELETE)
+		states.on_exit(self.select_background, State.DEATH)
+		states.start()
+
+	def init_input(self) -> None:
+		self.input: InputDispatcher = InputDispatcher(self.states)
+		self.input.measure_latency = self.measure_input_latency
+		if self.render_scale != 1:
+			# Game code works in logical coordinates, pg.SCALED isn't there to map the mouse for us
+			self.input.map_event = self.logical_event
+
+		for event_type in (pg.QUIT, pg.KEYDOWN, pg.VIDEOEXPOSE, pg.VIDEORESIZE, pg.WINDOWEXPOSED, pg.WINDOWSIZECHANGED):
+			self.input.add(event_type, self.handle_window_event)
+
+		# Earlier handlers get the event first, the volume button is checked before a click starts the game
+		self.input.add(pg.MOUSEBUTTONDOWN, self.ui.click_volume, State.MAIN, State.DEATH)
+		self.input.add(pg.MOUSEBUTTONDOWN, self.flappy_bird.on_click, State.MAIN, State.PLAY)
+		self.input.add(pg.MOUSEBUTTONDOWN, self.ui.click_restart, State.DEATH)
+		self.input.add(pg.KEYDOWN, self.flappy_bird.on_key, State.MAIN, State.PLAY)
+
+	def prepare_variants(self) -> None:
+		# Pipe columns, ground strips and rotations are built and pre-scaled here, behind the loading screen, instead of on their first frame
+		self.pipes.prepare()
+		self.background.prepare()
+		if self.render_scale != 1:
+			self.assets.build_variants()
+
+	def init_profiler(self) -> None:
+		self.profiler: Profiler = Profiler(self)
+		self.show_profiler: bool = False # F3 toggles the performance overlay
+		self.profile_log: bool = False # records every frame and writes a csv to assets/data on exit
+
+		if self.profile_log:
+			self.profiler.add_sink(CsvSink(f"assets/data/profile_{time.strftime('%Y%m%d-%H%M%S')}.csv"))
+			self.profiler.enable()
+
+	def toggle_profiler(self) -> None:
+		self.show_profiler = not self.show_profiler
+		if self.show_profiler:
+			self.profiler.enable()
+
+		elif not self.profiler.sinks:
+			self.profiler.disable()
+
 	def init_background(self) -> None:
 		self.current_time: str = random.choice(self.time_of_day[:2])
-		self.background_image: pg.Surface = pg.image.load(f"assets/sprites/background/{self.current_time}.png").convert()
+		self.background_image: pg.Surface = self.assets.image(f"assets/sprites/background/{self.current_time}.png", alpha=False)
 
 		self.background_x: float = self.screen_width / 1000
 		self.background_y: float = self.screen_height / -10
 
-		self.background_selected: bool = False
-
 	# Not lazy, background is stationary in flappy bird
-	def update_background(self) -> None:
-		if self.flappy_bird.menu == "death":
-			self.background_selected = False
+	def render_background(self, screen: pg.Surface) -> None:
+		# Whole pixels like pygame would place it at 800x600, otherwise scaling shows the sub-pixel offset as a gap
+		screen.blit(self.background_image, (int(self.background_x), int(self.background_y)))
 
-		else:
-			if not self.background_selected:
-				if self.flappy_bird.mode == "normal":
-					self.current_time = random.choice(self.time_of_day[:2])
+	# A new time of day is picked for every run once the death screen is left
+	def select_background(self) -> None:
+		if self.flappy_bird.mode == "normal":
+			self.current_time = random.choice(self.time_of_day[:2])
 
-				elif self.flappy_bird.mode == "impossible":
-					self.current_time = self.flappy_bird.mode
+		elif self.flappy_bird.mode == "impossible":
+			self.current_time = self.flappy_bird.mode
 
-				self.background_image = pg.image.load(f"assets/sprites/background/{self.current_time}.png").convert()
-				self.background_selected = True
+		self.background_image = self.assets.image(f"assets/sprites/background/{self.current_time}.png", alpha=False)
 
-		self.screen.blit(self.background_image, (self.background_x, self.background_y))
+	def update_bird(self) -> None:
+		self.flappy_bird.update(self.pipes)
 
 	def update(self) -> None:
-		self.update_background()
-		self.pipes.update(self.screen, self.volume)
-		self.background.update(self.screen)
-		self.flappy_bird.update(self.screen, self.events, self.pipes, self.volume)
-		self.ui.update(self.screen, self.font, self.clock, self.events)
-		self.creator.update()
+		self.states.update()
+
+	def render(self, alpha: float) -> None:
+		if self.dirty_rendering:
+			if self.scaled_screen is not None:
+				self.renderer.set_background(self.assets.variant(self.background_image), self.scaled_screen.point(int(self.background_x), int(self.background_y)))
+
+			else:
+				self.renderer.set_background(self.background_image, (self.background_x, self.background_y))
+
+			target: pg.Surface = self.renderer.begin()
+
+		else:
+			target = self.screen
+
+		output: pg.Surface = target
+		if self.scaled_screen is not None:
+			self.scaled_screen.surface = target
+			target = self.scaled_screen
+
+		screen: pg.Surface = self.profiler.screen(target)
+		if not self.dirty_rendering:
+			self.render_background(screen)
+
+		self.states.render(screen, alpha)
+
+		if self.show_profiler:
+			# Straight onto the output at its own resolution, the panel is redrawn in place every frame so it has no scaled variant to reuse
+			self.profiler.render_overlay(output)
+
+	def present(self) -> None:
+		if self.dirty_rendering:
+			self.renderer.present()
+
+		else:
+			pg.display.flip()
+
+		self.input.presented()
 
 	def handle_events(self) -> None:
-		self.events: list[pg.event.Event] = pg.event.get()
-		for event in self.events:
-			if event.type == pg.QUIT:
+		# Events wait in the dispatcher until the next simulation step, a frame can render without stepping
+		self.input.poll()
+
+	def handle_window_event(self, event: pg.event.Event) -> None:
+		if event.type == pg.QUIT:
+			self.running = False
+
+		elif event.type in {pg.VIDEOEXPOSE, pg.VIDEORESIZE, pg.WINDOWEXPOSED, pg.WINDOWSIZECHANGED}:
+			self.renderer.invalidate()
+
+		elif event.type == pg.KEYDOWN:
+			if event.key == pg.K_ESCAPE:
 				self.running = False
-	
-			elif event.type == pg.KEYDOWN:
-				if event.key == pg.K_ESCAPE:
-					self.running = False
-	 
-				if event.key == pg.K_o:
-					self.flappy_bird.menu = "death"
-    
-				if event.key == pg.K_p:
-					self.flappy_bird.restart()
+
+			if event.key == pg.K_o:
+				self.states.change(State.DEATH)
+
+			if event.key == pg.K_p:
+				self.flappy_bird.restart()
+
+			if event.key == pg.K_F3:
+				self.toggle_profiler()
+
+	def logical_event(self, event: pg.event.Event) -> pg.event.Event:
+		attributes: dict = dict(event.dict)
+		attributes["pos"] = (int(event.pos[0] / self.render_scale), int(event.pos[1] / self.render_scale))
+
+		return pg.event.Event(event.type, attributes)
+
+	def physics_profile(self) -> PhysicsProfile:
+		return self.pipes.profile()
+
+	def step(self) -> None:
+		# Input is handled before anything moves, a flap polled this frame already changes this step
+		self.flappy_bird.flapped = False
+		self.input.dispatch()
+
+		playing: bool = self.record_replays and self.states.state is State.PLAY
+		if playing and not self.recorder.recording:
+			self.recorder.start(self.physics_profile(), self.pipes.seed, self.flappy_bird.y, self.flappy_bird.vel_y)
+
+		elif not playing and self.recorder.recording:
+			self.recorder.discard()
+
+		self.update()
+		self.sounds.flush()
+
+		if playing:
+			self.recorder.record_step(self.flappy_bird.flapped and not self.flappy_bird.dead)
+			if self.states.state is State.DEATH:
+				logging.info(f"Replay saved to {self.recorder.finish(self.flappy_bird.score)}")
+
+			elif self.states.state is not State.PLAY:
+				self.recorder.discard()
 
 	def run_game(self) -> None:
+		# Fixed timestep: the simulation always advances in 1 / fps steps, rendering interpolates between the last two
 		self.running: bool = True
+		self.accumulator: float = self.step_time
+
+		previous_time: float = time.perf_counter()
 		while self.running:
+			if self.profiler.enabled:
+				self.profiler.begin_frame()
+
+			current_time: float = time.perf_counter()
+			self.accumulator += min(current_time - previous_time, self.max_frame_time)
+			previous_time = current_time
+
 			self.handle_events()
-			self.volume: int = 1 if self.ui.volume_on else 0
-			self.update()
 
-			pg.display.flip()
-			self.clock.tick(self.fps)
+			while self.accumulator >= self.step_time:
+				self.step()
+				self.accumulator -= self.step_time
+
+			self.render(self.accumulator / self.step_time)
+			self.present()
+			if self.profiler.enabled:
+				self.profiler.end_frame()
+
+			self.clock.tick(self.render_fps)
+
+		self.profiler.close()
+		self.skin_catalog.stop_watcher()
+		self.scores.close()
+		if self.input.measure_latency:
+			logging.info(self.input.latency_report())
 
 		print("Thanks for playing!")
 		pg.quit()
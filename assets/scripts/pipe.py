@@ -1,15 +1,19 @@
 import pygame as pg
-import random
 
-pg.mixer.init()
+from collections import deque
+from simulation import Course, Obstacle, PhysicsProfile
 
 class Pipes:
 	def __init__(self, game, bird_instance) -> None:
 		self.screen_width: int = game.screen_width
 		self.screen_height: int = game.screen_height
 		self.bird_instance = bird_instance
+		self.fps: int = game.fps
+		self.assets: 'AssetManager' = game.assets # type: ignore
 
-		self.pipes: list[Pipe] = []
+		# Active pipes ordered by x, oldest (leftmost) first, so removal happens off the front
+		self.pipes: deque[Pipe] = deque()
+		self.pool: list[Pipe] = []
 		self.pipe_width: int = 104
 		self.gap: int = 200
 		self.speed: int = 5
@@ -17,118 +21,153 @@ class Pipes:
 		self.max_timer: int = 200
 		self.min_timer: int = 120
 
-		self.timer: float = self.max_timer
-		self.remove_all_pipes: bool = True
-
 		self.decrement_factor: float = 0.3
 		self.decrement_value: float = 0.1
 
-	def update(self, screen: pg.Surface, volume: int) -> None:
-		if self.bird_instance.menu in {"main", "play", "death"}:
-			self.timed_spawn()
-			self.remove_offscreen_pipes()
+		# Each run's pipes come from a course generated from its seed, the same seed always gives the same pipes
+		self.course: Course = Course(self.profile(), None, self.screen_width, self.screen_height)
+		self.frame: int = 0
+		self.next_obstacle: int = 0
 
-			if self.bird_instance.menu == "main":
-				self.reset_timer()
+		self.sounds: 'SoundBank' = game.sounds # type: ignore
+		self.scroll: 'Scroll' = game.scroll # type: ignore
 
-			for pipe in self.pipes:
-				if self.bird_instance.menu == "play":
-					pipe.move()
-					pipe.increase_score()
-				pipe.update(screen, volume)
+	def update(self) -> None:
+		# Only runs while playing, pipes stand still on the death screen and are cleared when going back to the main menu
+		self.spawn_due()
+		self.remove_offscreen_pipes()
 
-		else:
-			self.remove_pipes()
+		for pipe in self.pipes:
+			pipe.move(self.scroll.delta)
+			pipe.increase_score()
+			pipe.update()
+
+	def freeze(self) -> None:
+		for pipe in self.pipes:
+			pipe.prev_x = pipe.x
+
+	def reset(self) -> None:
+		self.remove_pipes()
+		self.new_run()
+
+	def render(self, screen: pg.Surface, alpha: float = 1) -> None:
+		for pipe in self.pipes:
+			pipe.render(screen, alpha)
 
 	def remove_pipes(self) -> None:
-		self.pipes = []
-
-	def spawn_pipe(self) -> None:
-		min_y: int = 50
-		max_y: int = self.screen_height - 300
-  
-		y: int = random.randint(min_y, max_y)
-  
-		pipe: Pipe = Pipe(self.screen_width, self.screen_height, y, self.pipe_width, self.gap, self.bird_instance.vel_x, self.bird_instance)
+		self.pool.extend(self.pipes)
+		self.pipes.clear()
+
+	def prepare(self) -> None:
+		for theme in ("assets/sprites/obstacle/pipe.png", "assets/sprites/obstacle/building.png"):
+			self.assets.flipped_image(theme)
+
+	def pipe_theme(self) -> str:
+		if self.bird_instance.skin_selected == "plane":
+			return "assets/sprites/obstacle/building.png"
+
+		else:
+			return "assets/sprites/obstacle/pipe.png"
+
+	def pipe_columns(self, y: int) -> tuple[pg.Surface, pg.Surface]:
+		theme: str = self.pipe_theme()
+
+		return self.assets.pipe_column(theme, self.pipe_width, y, True), self.assets.pipe_column(theme, self.pipe_width, self.screen_height - y - self.gap, False)
+
+	def spawn_pipe(self, y: int) -> None:
+		upper_pipe_image, lower_pipe_image = self.pipe_columns(y)
+		if self.pool:
+			pipe: Pipe = self.pool.pop()
+			pipe.reset(self.screen_width, y, upper_pipe_image, lower_pipe_image)
+
+		else:
+			pipe = Pipe(self.screen_width, self.screen_height, y, self.pipe_width, self.gap, self.bird_instance, upper_pipe_image, lower_pipe_image, self.sounds)
+
 		self.pipes.append(pipe)
 
 	def remove_offscreen_pipes(self) -> None:
-		self.pipes = [pipe for pipe in self.pipes if pipe.x > -self.pipe_width]
+		while self.pipes and self.pipes[0].x <= -self.pipe_width:
+			self.pool.append(self.pipes.popleft())
+
+	@property
+	def seed(self) -> int:
+		return self.course.seed
+
+	def profile(self) -> PhysicsProfile:
+		bird = self.bird_instance
 
-	def reset_timer(self) -> None:
-		self.max_timer = 200
-		self.timer = self.max_timer
-		self.remove_all_pipes = True
+		return PhysicsProfile(bird.mode, self.fps, bird.vel_x, bird.gravity, bird.jump_strength, self.max_timer, self.min_timer, self.decrement_value, self.decrement_factor)
 
-	def timed_spawn(self) -> None:
-		if self.bird_instance.menu == "play":
-			self.remove_all_pipes = True
-			if self.timer <= 0:
-				self.spawn_pipe()
-				self.timer = self.max_timer
-				self.max_timer = max(self.min_timer, self.max_timer - 2.5)
+	def new_run(self, seed: int | None = None) -> None:
+		self.course.reset(seed, self.profile())
+		self.frame = 0
+		self.next_obstacle = 0
 
-			else:
-				self.timer -= self.decrement_value + self.bird_instance.vel_x * self.decrement_factor
+	def spawn_due(self) -> None:
+		obstacle: Obstacle = self.course[self.next_obstacle]
+		if obstacle.frame == self.frame:
+			self.spawn_pipe(obstacle.gap_y)
+			self.next_obstacle += 1
 
-		elif self.bird_instance.menu == "main":
-			if self.remove_all_pipes:
-				self.remove_pipes()
-				self.remove_all_pipes = False
+		self.frame += 1
+
+	def lookahead(self, count: int) -> list[Obstacle]:
+		# Pipes that haven't entered the screen yet, next one first
+		return self.course.lookahead(self.next_obstacle, count)
 
 class Pipe:
-	def __init__(self, screen_width: int, screen_height: int, y: int, pipe_width: int, gap: int, speed: int, bird_instance) -> None:
-		self.x: int = screen_width
-		self.y: int = y
+	__slots__ = (
+		"x", "prev_x", "y", "pipe_width", "gap", "screen_height", "bird_instance", "sounds", "score_increment",
+		"upper_pipe_rect", "lower_pipe_rect", "upper_pipe_image", "lower_pipe_image"
+	)
+
+	def __init__(self, screen_width: int, screen_height: int, y: int, pipe_width: int, gap: int, bird_instance, upper_pipe_image: pg.Surface, lower_pipe_image: pg.Surface, sounds: 'SoundBank') -> None: # type: ignore
 		self.pipe_width: int = pipe_width
 		self.gap: int = gap
-		self.speed: int = speed
 		self.screen_height: int = screen_height
 
 		self.bird_instance = bird_instance
-		self.pipe_image: pg.Surface = self.load_pipe_image()
-		self.point_sound: pg.mixer.Sound = pg.mixer.Sound("assets/sounds/player/sfx_point.wav")
-		self.score_increment: bool = True
+		self.sounds: 'SoundBank' = sounds # type: ignore
 
-		self.update_pipe_rects()
+		self.upper_pipe_rect: pg.Rect = pg.Rect(0, 0, pipe_width, 0)
+		self.lower_pipe_rect: pg.Rect = pg.Rect(0, 0, pipe_width, 0)
 
-	def load_pipe_image(self) -> pg.Surface:
-		if self.bird_instance.skin_selected == "plane":
-			return pg.image.load("assets/sprites/obstacle/building.png").convert_alpha()
+		self.reset(screen_width, y, upper_pipe_image, lower_pipe_image)
 
-		else:
-			return pg.image.load("assets/sprites/obstacle/pipe.png").convert_alpha()
+	def reset(self, x: int, y: int, upper_pipe_image: pg.Surface, lower_pipe_image: pg.Surface) -> None:
+		self.x: int = x
+		self.prev_x: int = x
+		self.y: int = y
+		self.score_increment: bool = True
+
+		# Columns are pre-composited per theme and height, moving only changes x
+		self.upper_pipe_image: pg.Surface = upper_pipe_image
+		self.lower_pipe_image: pg.Surface = lower_pipe_image
 
-	def update_pipe_rects(self) -> None:
-		self.upper_pipe_rect: pg.Rect = pg.Rect(self.x, 0, self.pipe_width, self.y)
-		self.lower_pipe_rect: pg.Rect = pg.Rect(self.x, self.y + self.gap, self.pipe_width, self.screen_height - self.y - self.gap)
+		self.upper_pipe_rect.update(self.x, 0, self.pipe_width, self.y)
+		self.lower_pipe_rect.update(self.x, self.y + self.gap, self.pipe_width, self.screen_height - self.y - self.gap)
 
-		self.upper_pipe_image: pg.Surface = self.pipe_image.subsurface((0, 0, self.pipe_width, self.y))
-		self.lower_pipe_image: pg.Surface = self.pipe_image.subsurface((0, 0, self.pipe_width, self.screen_height - self.y - self.gap))
+	def render(self, screen: pg.Surface, alpha: float = 1) -> None:
+		x: float = self.prev_x + (self.x - self.prev_x) * alpha
 
-	def render(self, screen: pg.Surface) -> None:
-		flipped_upper_pipe_image: pg.Surface = pg.transform.flip(self.upper_pipe_image, False, True)
-		screen.blit(flipped_upper_pipe_image, (self.x, 0))
-		screen.blit(self.lower_pipe_image, (self.x, self.y + self.gap))
+		screen.blit(self.upper_pipe_image, (x, 0))
+		screen.blit(self.lower_pipe_image, (x, self.y + self.gap))
 
 		# pipe hitboxes
 		# pg.draw.rect(screen, (255, 0, 0), self.upper_pipe_rect, 2)
 		# pg.draw.rect(screen, (255, 0, 0), self.lower_pipe_rect, 2)
 
-	def update(self, screen: pg.Surface, volume: int) -> None:
-		self.render(screen)
-		self.volume(volume)
+	def update(self) -> None:
 		self.increase_score()
 
-	def move(self) -> None:
-		self.x -= self.speed
-		self.update_pipe_rects()
-
-	def volume(self, volume: int) -> None:
-		self.point_sound.set_volume(volume)
+	def move(self, distance: int) -> None:
+		self.prev_x = self.x
+		self.x -= distance
+		self.upper_pipe_rect.x = self.x
+		self.lower_pipe_rect.x = self.x
 
 	def increase_score(self) -> None:
 		if self.x <= self.bird_instance.x and self.score_increment:
 			self.bird_instance.score += 1
-			self.point_sound.play()
+			self.sounds.play("point")
 			self.score_increment = False
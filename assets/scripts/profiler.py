@@ -0,0 +1,208 @@
+import pygame as pg
+import time
+import csv
+
+from collections import deque
+from text import TextCache
+
+SUBSYSTEMS: tuple[str, ...] = ("pipes", "bird", "background", "ui", "creator")
+
+class RingBufferSink:
+	def __init__(self, capacity: int = 600) -> None:
+		self.samples: deque[dict[str, float]] = deque(maxlen=capacity)
+
+	def record(self, sample: dict[str, float]) -> None:
+		self.samples.append(sample)
+
+	def close(self) -> None:
+		pass
+
+class CsvSink(RingBufferSink):
+	# Keeps the last samples in memory and dumps them when the game exits
+	def __init__(self, path: str, capacity: int = 100_000) -> None:
+		super().__init__(capacity)
+		self.path: str = path
+
+	def close(self) -> None:
+		if not self.samples:
+			return
+
+		with open(self.path, "w", newline="") as file:
+			writer: csv.DictWriter = csv.DictWriter(file, fieldnames=list(self.samples[0]))
+			writer.writeheader()
+			writer.writerows(self.samples)
+
+class CountingSurface:
+	# Stands in for the screen while profiling so blits can be counted, everything else goes to the real surface
+	def __init__(self, surface: pg.Surface, profiler: 'Profiler') -> None:
+		self.surface: pg.Surface = surface
+		self.profiler: 'Profiler' = profiler
+
+	def blit(self, *args, **kwargs) -> pg.Rect:
+		self.profiler.blits += 1
+		return self.surface.blit(*args, **kwargs)
+
+	def __getattr__(self, name: str):
+		return getattr(self.surface, name)
+
+class Profiler:
+	def __init__(self, game: 'FlappyBirdGame', history: int = 120) -> None: # type: ignore
+		self.game: 'FlappyBirdGame' = game # type: ignore
+
+		self.enabled: bool = False
+		self.sinks: list[RingBufferSink] = []
+
+		self.history: deque[float] = deque(maxlen=history)
+		self.costs: dict[str, float] = dict.fromkeys(SUBSYSTEMS, 0.0)
+		self.last_costs: dict[str, float] = dict(self.costs)
+
+		self.blits: int = 0
+		self.allocations: int = 0
+		self.disk_reads: int = 0
+		self.last_counts: tuple[int, int, int] = (0, 0, 0)
+
+		self.frame: int = 0
+		self.frame_start: float = 0
+		self.disk_reads_start: int = 0
+		self.text_renders_start: int = 0
+		self.overlay_renders_start: int = 0
+
+		self.wrapped: list[tuple[object, str]] = []
+		self.transform_functions: dict[str, object] = {}
+
+		# The panel is reused every frame, only the lines whose numbers changed are rendered again
+		self.panel: pg.Rect = pg.Rect(10, 10, 230, 210)
+		self.overlay: pg.Surface | None = None
+		self.text_cache: TextCache | None = None
+
+	def add_sink(self, sink: RingBufferSink) -> None:
+		self.sinks.append(sink)
+
+	def enable(self) -> None:
+		if self.enabled:
+			return
+
+		self.enabled = True
+		self.frame_start = time.perf_counter()
+		self.disk_reads_start = self.game.assets.disk_reads
+		game = self.game
+		for subsystem, owner, method in (
+			("background", game, "render_background"),
+			("pipes", game.pipes, "update"), ("pipes", game.pipes, "render"),
+			("background", game.background, "update"), ("background", game.background, "render"),
+			("bird", game.flappy_bird, "update"), ("bird", game.flappy_bird, "render"),
+			("ui", game.ui, "render_main"), ("ui", game.ui, "render_play"), ("ui", game.ui, "render_death"),
+			("creator", game.creator, "update"), ("creator", game.creator, "render"),
+		):
+			self.instrument(subsystem, owner, method)
+
+		# Apart from text cache misses, every surface the frame loop creates goes through pg.transform
+		for name in ("rotate", "rotozoom", "flip", "scale", "smoothscale"):
+			function = getattr(pg.transform, name)
+			self.transform_functions[name] = function
+			setattr(pg.transform, name, self.counted(function))
+
+	def disable(self) -> None:
+		self.enabled = False
+		for owner, method in self.wrapped:
+			delattr(owner, method)
+
+		self.wrapped.clear()
+
+		for name, function in self.transform_functions.items():
+			setattr(pg.transform, name, function)
+
+		self.transform_functions.clear()
+
+	def instrument(self, subsystem: str, owner: object, method: str) -> None:
+		function = getattr(owner, method)
+		costs: dict[str, float] = self.costs
+
+		def timed(*args, **kwargs):
+			start: float = time.perf_counter()
+			result = function(*args, **kwargs)
+			costs[subsystem] += time.perf_counter() - start
+			return result
+
+		setattr(owner, method, timed)
+		self.wrapped.append((owner, method))
+
+	def counted(self, function):
+		def wrapper(*args, **kwargs):
+			self.allocations += 1
+			return function(*args, **kwargs)
+
+		return wrapper
+
+	def screen(self, screen: pg.Surface) -> pg.Surface:
+		return CountingSurface(screen, self) if self.enabled else screen
+
+	def begin_frame(self) -> None:
+		self.frame_start = time.perf_counter()
+		self.disk_reads_start = self.game.assets.disk_reads
+		self.text_renders_start = self.game.ui.text_cache.renders
+		self.overlay_renders_start = self.text_cache.renders if self.text_cache is not None else 0
+		for subsystem in self.costs:
+			self.costs[subsystem] = 0.0
+
+		self.blits = 0
+		self.allocations = 0
+
+	def end_frame(self) -> None:
+		frame_time: float = time.perf_counter() - self.frame_start
+		self.disk_reads = self.game.assets.disk_reads - self.disk_reads_start
+		self.allocations += self.game.ui.text_cache.renders - self.text_renders_start
+		if self.text_cache is not None:
+			self.allocations += self.text_cache.renders - self.overlay_renders_start
+
+		self.history.append(frame_time)
+		self.last_costs = dict(self.costs)
+		self.last_counts = (self.blits, self.allocations, self.disk_reads)
+		self.frame += 1
+
+		if self.sinks:
+			sample: dict[str, float] = {"frame": self.frame, "frame_ms": frame_time * 1000}
+			for subsystem, cost in self.last_costs.items():
+				sample[f"{subsystem}_ms"] = cost * 1000
+
+			sample["blits"], sample["allocations"], sample["disk_reads"] = self.last_counts
+			for sink in self.sinks:
+				sink.record(sample)
+
+	def close(self) -> None:
+		self.disable()
+		for sink in self.sinks:
+			sink.close()
+
+	def render_overlay(self, screen: pg.Surface) -> None:
+		if not self.history:
+			return
+
+		if self.overlay is None:
+			self.overlay = pg.Surface(self.panel.size, pg.SRCALPHA)
+			self.text_cache = TextCache(pg.font.Font("assets/sprites/font/flappy_bird.ttf", 16), max_entries=128)
+
+		overlay: pg.Surface = self.overlay
+		overlay.fill((0, 0, 0, 160))
+
+		frame_ms: float = self.history[-1] * 1000
+		blits, allocations, disk_reads = self.last_counts
+		lines: list[str] = [f"frame {frame_ms:.2f} ms  ({1000 / max(frame_ms, 0.001):.0f} fps)"]
+		lines += [f"{subsystem} {cost * 1000:.3f} ms" for subsystem, cost in self.last_costs.items()]
+		lines.append(f"blits {blits}  allocs {allocations}  reads {disk_reads}")
+
+		for index, line in enumerate(lines):
+			overlay.blit(self.text_cache.get(line, (255, 255, 255))[1], (8, 6 + index * 18))
+
+		# Rolling frame-time graph, the line marks the simulation step budget
+		graph: pg.Rect = pg.Rect(8, 140, self.panel.width - 16, 60)
+		scale: float = graph.height / max(max(self.history), self.game.step_time * 2)
+		budget_y: float = graph.bottom - self.game.step_time * scale
+		pg.draw.line(overlay, (255, 80, 80), (graph.left, budget_y), (graph.right, budget_y))
+
+		step: float = graph.width / max(1, self.history.maxlen - 1)
+		points: list[tuple[float, float]] = [(graph.left + index * step, graph.bottom - sample * scale) for index, sample in enumerate(self.history)]
+		if len(points) > 1:
+			pg.draw.lines(overlay, (120, 255, 120), False, points)
+
+		screen.blit(overlay, self.panel.topleft)
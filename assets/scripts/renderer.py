@@ -0,0 +1,110 @@
+import pygame as pg
+
+class TrackingSurface:
+	# Stands in for the screen and remembers the area every blit touched
+	def __init__(self, surface: pg.Surface, rects: list[pg.Rect]) -> None:
+		self.surface: pg.Surface = surface
+		self.rects: list[pg.Rect] = rects
+
+	def blit(self, *args, **kwargs) -> pg.Rect:
+		rect: pg.Rect = self.surface.blit(*args, **kwargs)
+		if rect.width and rect.height:
+			self.rects.append(rect)
+
+		return rect
+
+	def __getattr__(self, name: str):
+		return getattr(self.surface, name)
+
+class ScaledSurface:
+	# Takes drawing in logical screen coordinates and puts it on a larger output, sources are swapped for their pre-scaled variants
+	def __init__(self, surface: pg.Surface, assets: 'AssetManager', logical_size: tuple[int, int]) -> None: # type: ignore
+		self.surface: pg.Surface = surface
+		self.assets: 'AssetManager' = assets # type: ignore
+		self.scale: float = assets.scale
+		self.logical_rect: pg.Rect = pg.Rect((0, 0), logical_size)
+
+	def point(self, x: float, y: float) -> tuple[int, int]:
+		return round(x * self.scale), round(y * self.scale)
+
+	def rect(self, rect: pg.Rect | tuple) -> pg.Rect:
+		rect = pg.Rect(rect)
+		left, top = self.point(rect.left, rect.top)
+		right, bottom = self.point(rect.right, rect.bottom)
+
+		return pg.Rect(left, top, right - left, bottom - top)
+
+	def blit(self, source: pg.Surface, dest, area: pg.Rect | None = None, special_flags: int = 0) -> pg.Rect:
+		return self.surface.blit(self.assets.variant(source), self.point(dest[0], dest[1]), None if area is None else self.rect(area), special_flags)
+
+	def fill(self, color, rect: pg.Rect | None = None, special_flags: int = 0) -> pg.Rect:
+		return self.surface.fill(color, None if rect is None else self.rect(rect), special_flags)
+
+	def get_width(self) -> int:
+		return self.logical_rect.width
+
+	def get_height(self) -> int:
+		return self.logical_rect.height
+
+	def get_size(self) -> tuple[int, int]:
+		return self.logical_rect.size
+
+	def get_rect(self, **kwargs) -> pg.Rect:
+		rect: pg.Rect = self.logical_rect.copy()
+		for name, value in kwargs.items():
+			setattr(rect, name, value)
+
+		return rect
+
+	def __getattr__(self, name: str):
+		return getattr(self.surface, name)
+
+class DirtyRenderer:
+	def __init__(self, screen: pg.Surface, max_rects: int = 48) -> None:
+		self.screen: pg.Surface = screen
+		self.screen_rect: pg.Rect = screen.get_rect()
+
+		# The sky never moves, so it's kept pre-blitted at screen size and used to erase last frame's sprites
+		self.static_layer: pg.Surface = pg.Surface(self.screen_rect.size).convert()
+		self.static_key: tuple[int, tuple[float, float]] | None = None
+
+		self.rects: list[pg.Rect] = []
+		self.previous_rects: list[pg.Rect] = []
+		self.tracking: TrackingSurface = TrackingSurface(screen, self.rects)
+
+		# Past this many rects a single full-screen update is cheaper than many small ones
+		self.max_rects: int = max_rects
+		self.full_redraw: bool = True
+
+	def invalidate(self) -> None:
+		self.full_redraw = True
+
+	def set_background(self, image: pg.Surface, position: tuple[float, float]) -> None:
+		key: tuple[int, tuple[float, float]] = (id(image), position)
+		if key != self.static_key:
+			self.static_layer.fill((0, 0, 0))
+			self.static_layer.blit(image, position)
+			self.static_key = key
+			self.full_redraw = True
+
+	def begin(self) -> TrackingSurface:
+		self.rects.clear()
+		if self.full_redraw:
+			self.screen.blit(self.static_layer, (0, 0))
+
+		else:
+			for rect in self.previous_rects:
+				self.screen.blit(self.static_layer, rect, rect)
+
+		return self.tracking
+
+	def present(self) -> None:
+		drawn: list[pg.Rect] = [rect.clip(self.screen_rect) for rect in self.rects]
+		if self.full_redraw or len(drawn) + len(self.previous_rects) > self.max_rects:
+			pg.display.flip()
+
+		else:
+			pg.display.update(self.previous_rects + drawn)
+
+		self.previous_rects = drawn
+		self.full_redraw = False
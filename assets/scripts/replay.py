@@ -0,0 +1,242 @@
+import argparse
+import struct
+import time
+import os
+
+from simulation import PhysicsProfile, Simulation
+
+# File layout (little endian):
+#   b"FBRP", version u8
+#   profile name (u8 length + utf-8), fps u16, vel_x, gravity, jump_strength, max_timer, min_timer, decrement_value, decrement_factor as f64
+#   pipe seed u32, start y f64, start vel_y f64
+#   frames, score, flap count as varints, then the gaps between flap frames as varints (usually one or two bytes per flap)
+
+MAGIC: bytes = b"FBRP"
+VERSION: int = 3 # 2: a flap applies at the start of its frame, before the bird moves, 3: pipes come from simulation.Course
+
+def write_varint(buffer: bytearray, value: int) -> None:
+	while value >= 0x80:
+		buffer.append((value & 0x7F) | 0x80)
+		value >>= 7
+
+	buffer.append(value)
+
+def read_varint(data: bytes, offset: int) -> tuple[int, int]:
+	value: int = 0
+	shift: int = 0
+	while True:
+		byte: int = data[offset]
+		offset += 1
+		value |= (byte & 0x7F) << shift
+		if byte < 0x80:
+			return value, offset
+
+		shift += 7
+
+class Replay:
+	def __init__(self, profile: PhysicsProfile, seed: int, start_y: float, start_vel_y: float, flaps: list[int] | None = None, frames: int = 0, score: int = 0) -> None:
+		self.profile: PhysicsProfile = profile
+		self.seed: int = seed
+		self.start_y: float = start_y
+		self.start_vel_y: float = start_vel_y
+
+		# Frame indices (since the first "play" frame) on which the bird flapped, in increasing order
+		self.flaps: list[int] = flaps if flaps is not None else []
+		self.frames: int = frames
+		self.score: int = score
+
+	def to_bytes(self) -> bytes:
+		profile: PhysicsProfile = self.profile
+		name: bytes = profile.name.encode()[:255]
+
+		buffer: bytearray = bytearray(MAGIC)
+		buffer.append(VERSION)
+		buffer.append(len(name))
+		buffer += name
+		buffer += struct.pack("<H7d", profile.fps, profile.vel_x, profile.gravity, profile.jump_strength, profile.max_timer, profile.min_timer, profile.decrement_value, profile.decrement_factor)
+		buffer += struct.pack("<I2d", self.seed, self.start_y, self.start_vel_y)
+
+		write_varint(buffer, self.frames)
+		write_varint(buffer, self.score)
+		write_varint(buffer, len(self.flaps))
+		previous: int = 0
+		for frame in self.flaps:
+			write_varint(buffer, frame - previous)
+			previous = frame
+
+		return bytes(buffer)
+
+	@classmethod
+	def from_bytes(cls, data: bytes) -> 'Replay':
+		if data[:4] != MAGIC:
+			raise ValueError("not a replay file")
+
+		if data[4] != VERSION:
+			raise ValueError(f"unsupported replay version {data[4]}")
+
+		name_length: int = data[5]
+		offset: int = 6 + name_length
+		name: str = data[6:offset].decode()
+
+		fps, *constants = struct.unpack_from("<H7d", data, offset)
+		offset += struct.calcsize("<H7d")
+		seed, start_y, start_vel_y = struct.unpack_from("<I2d", data, offset)
+		offset += struct.calcsize("<I2d")
+
+		frames, offset = read_varint(data, offset)
+		score, offset = read_varint(data, offset)
+		count, offset = read_varint(data, offset)
+
+		flaps: list[int] = []
+		frame: int = 0
+		for _ in range(count):
+			delta, offset = read_varint(data, offset)
+			frame += delta
+			flaps.append(frame)
+
+		profile: PhysicsProfile = PhysicsProfile(name, fps, *constants)
+
+		return cls(profile, seed, start_y, start_vel_y, flaps, frames, score)
+
+	def save(self, path: str) -> None:
+		directory: str = os.path.dirname(path)
+		if directory:
+			os.makedirs(directory, exist_ok=True)
+
+		with open(path, "wb") as file:
+			file.write(self.to_bytes())
+
+	@classmethod
+	def load(cls, path: str) -> 'Replay':
+		with open(path, "rb") as file:
+			return cls.from_bytes(file.read())
+
+class ReplayRecorder:
+	def __init__(self, directory: str = "assets/data/replays") -> None:
+		self.directory: str = directory
+		self.replay: Replay | None = None
+		self.last_path: str | None = None
+
+	@property
+	def recording(self) -> bool:
+		return self.replay is not None
+
+	def start(self, profile: PhysicsProfile, seed: int, start_y: float, start_vel_y: float) -> None:
+		self.replay = Replay(profile, seed, start_y, start_vel_y)
+
+	def record_step(self, flapped: bool) -> None:
+		if flapped:
+			self.replay.flaps.append(self.replay.frames)
+
+		self.replay.frames += 1
+
+	def discard(self) -> None:
+		self.replay = None
+
+	def finish(self, score: int) -> str:
+		replay: Replay = self.replay
+		replay.score = score
+		self.replay = None
+
+		path: str = os.path.join(self.directory, f"{time.strftime('%Y%m%d-%H%M%S')}_{replay.seed:08x}_{score}.fbr")
+		replay.save(path)
+		self.last_path = path
+
+		return path
+
+class ReplayPlayer:
+	# Re-simulates a replay headlessly, skipped frames are stepped without being drawn
+	def __init__(self, replay: Replay) -> None:
+		self.replay: Replay = replay
+		self.flaps: set[int] = set(replay.flaps)
+		self.simulation: Simulation = Simulation(replay.profile, replay.seed)
+		self.rewind()
+
+	def rewind(self) -> None:
+		self.simulation.reset(self.replay.seed, self.replay.start_y, self.replay.start_vel_y)
+
+	@property
+	def frame(self) -> int:
+		return self.simulation.frame
+
+	@property
+	def finished(self) -> bool:
+		return self.simulation.bird.dead or self.simulation.frame >= self.replay.frames
+
+	def step(self) -> bool:
+		if self.finished:
+			return False
+
+		self.simulation.step(self.simulation.frame in self.flaps)
+
+		return True
+
+	def seek(self, frame: int) -> None:
+		if frame < self.simulation.frame:
+			self.rewind()
+
+		while self.simulation.frame < frame and self.step():
+			pass
+
+	def fast_forward(self, frames: int) -> None:
+		self.seek(self.simulation.frame + frames)
+
+	def verify(self) -> bool:
+		self.seek(self.replay.frames)
+
+		return self.simulation.bird.dead and self.simulation.bird.score == self.replay.score
+
+def view(player: ReplayPlayer) -> None:
+	import pygame as pg
+	from sim_view import SimulationView
+
+	simulation: Simulation = player.simulation
+	window: SimulationView = SimulationView(simulation, "FlappyBird replay")
+
+	# Space pauses, right skips ahead 5 seconds, left jumps back 5 seconds, escape quits
+	paused: bool = False
+	running: bool = True
+	while running:
+		for event in pg.event.get():
+			if event.type == pg.QUIT or (event.type == pg.KEYDOWN and event.key == pg.K_ESCAPE):
+				running = False
+
+			elif event.type == pg.KEYDOWN:
+				if event.key == pg.K_SPACE:
+					paused = not paused
+
+				elif event.key == pg.K_RIGHT:
+					player.fast_forward(5 * simulation.profile.fps)
+
+				elif event.key == pg.K_LEFT:
+					player.seek(max(0, player.frame - 5 * simulation.profile.fps))
+
+		if not paused:
+			player.step()
+
+		window.draw(f"frame {player.frame}/{player.replay.frames}")
+		window.present(simulation.profile.fps)
+
+	window.close()
+
+def main() -> None:
+	parser: argparse.ArgumentParser = argparse.ArgumentParser(description="Inspect, verify or watch a FlappyBird replay.")
+	parser.add_argument("path")
+	parser.add_argument("--seek", type=int, default=0, help="start playback at this frame")
+	parser.add_argument("--view", action="store_true", help="watch the replay in a window")
+	args: argparse.Namespace = parser.parse_args()
+
+	replay: Replay = Replay.load(args.path)
+	print(f"profile {replay.profile.name}, seed {replay.seed}, {replay.frames} frames, {len(replay.flaps)} flaps, score {replay.score}, {os.path.getsize(args.path)} bytes")
+
+	player: ReplayPlayer = ReplayPlayer(replay)
+	start: float = time.perf_counter()
+	valid: bool = player.verify()
+	print(f"verified: {valid} (re-simulated in {(time.perf_counter() - start) * 1000:.1f} ms)")
+
+	if args.view:
+		player.seek(args.seek)
+		view(player)
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,122 @@
+import threading
+import logging
+import os
+
+class ScoreStore:
+	# Keeps the high score in memory, a background writer loads it and persists it at the end of a run or every flush_interval seconds
+	def __init__(self, path: str = "assets/data/high_score.txt", key_file: str = "assets/data/encryption_key.key", flush_interval: float = 5.0) -> None:
+		self.path: str = path
+		self.key_file: str = key_file
+		self.flush_interval: float = flush_interval
+
+		self.high_score: int = 0
+		self.decryption_error: bool = False
+		self.writes: int = 0
+
+		# cryptography is imported and the file decrypted on the writer thread, so the first frame waits for neither
+		self.cipher_suite: 'Fernet | None' = None # type: ignore
+
+		self.lock: threading.Lock = threading.Lock()
+		self.wake: threading.Event = threading.Event()
+		self.pending: bool = False
+		self.running: bool = True
+
+		self.writer: threading.Thread = threading.Thread(target=self.write_behind, daemon=True)
+		self.writer.start()
+
+	def load(self) -> None:
+		from cryptography.fernet import Fernet
+
+		try:
+			with open(self.key_file, "rb") as file:
+				key: bytes = file.read()
+
+		except FileNotFoundError:
+			key = Fernet.generate_key()
+			with open(self.key_file, "wb") as file:
+				file.write(key)
+
+		self.cipher_suite = Fernet(key)
+		try:
+			with open(self.path, "rb") as file:
+				encrypted_score: bytes = file.read()
+
+			try:
+				stored: int = int(self.cipher_suite.decrypt(encrypted_score).decode())
+				with self.lock:
+					# A score submitted before loading finished only survives if it beats the stored one
+					if stored >= self.high_score:
+						self.high_score = stored
+						self.pending = False
+
+				self.decryption_error = False
+
+			except Exception:
+				self.decryption_error = True
+				self.pending = True
+
+		except (FileNotFoundError, ValueError):
+			self.pending = True
+
+	def submit(self, score: int) -> bool:
+		# Called every frame, only touches memory
+		if score <= self.high_score:
+			return False
+
+		with self.lock:
+			self.high_score = score
+			self.pending = True
+
+		return True
+
+	def flush(self) -> None:
+		# Asks the writer to persist now instead of waiting for the timer
+		self.wake.set()
+
+	def close(self) -> None:
+		self.running = False
+		self.wake.set()
+		self.writer.join()
+		self.write()
+
+	def write_behind(self) -> None:
+		try:
+			self.load()
+
+		except (ImportError, OSError) as error:
+			# Without a key the high score still counts for this session, it just isn't saved
+			logging.warning(f"High score won't be saved: {error}")
+			return
+
+		while self.running:
+			self.wake.wait(self.flush_interval)
+			self.wake.clear()
+			self.write()
+
+	def write(self) -> None:
+		if self.cipher_suite is None:
+			return
+
+		with self.lock:
+			if not self.pending:
+				return
+
+			high_score: int = self.high_score
+			self.pending = False
+
+		encrypted_score: bytes = self.cipher_suite.encrypt(str(high_score).encode())
+
+		# Written next to the real file and renamed over it, a crash mid-write leaves the old score intact
+		temp_path: str = self.path + ".tmp"
+		try:
+			with open(temp_path, "wb") as file:
+				file.write(encrypted_score)
+				file.flush()
+				os.fsync(file.fileno())
+
+			os.replace(temp_path, self.path)
+			self.writes += 1
+
+		except OSError:
+			with self.lock:
+				self.pending = True
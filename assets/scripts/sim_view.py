@@ -0,0 +1,89 @@
+import pygame as pg
+
+from asset_manager import AssetManager
+from background import Background, Scroll
+from bird import Bird
+from pipe import Pipes
+from skin_catalog import SkinCatalog
+from simulation import Simulation
+from text import DigitAtlas, TextCache
+
+class SimulationView:
+	# Draws a headless Simulation through the game's own Bird, Pipes and Background render paths and shared AssetManager,
+	# standing in for the game object they read their settings from
+	def __init__(self, simulation: Simulation, caption: str = "FlappyBird", window: bool = True, assets: AssetManager | None = None) -> None:
+		pg.init()
+		self.simulation: Simulation = simulation
+		self.screen_width: int = simulation.screen_width
+		self.screen_height: int = simulation.screen_height
+		self.fps: int = simulation.profile.fps
+
+		# Without a window the frame is drawn to a hidden one, for grabbing it as an array
+		self.screen: pg.Surface = pg.display.set_mode((self.screen_width, self.screen_height), pg.SCALED | pg.RESIZABLE if window else pg.HIDDEN)
+		pg.display.set_caption(caption)
+		self.clock: pg.time.Clock = pg.time.Clock()
+
+		self.assets: AssetManager = assets if assets is not None else AssetManager()
+		self.skin_catalog: SkinCatalog = SkinCatalog()
+		self.scroll: Scroll = Scroll()
+		self.scores = None
+		self.states = None
+		self.sounds = None
+		self.pixel_perfect_collision: bool = False
+
+		self.bird: Bird = Bird(self, None)
+		self.pipes: Pipes = Pipes(self, self.bird)
+		self.background: Background = Background(self, self.bird)
+		self.pipes.prepare()
+		self.background.prepare()
+
+		font: pg.font.Font = pg.font.Font("assets/sprites/font/flappy_bird.ttf", 36)
+		self.score_digits: DigitAtlas = DigitAtlas(font, (255, 255, 255), (0, 0, 0))
+		self.text_cache: TextCache = TextCache(font)
+		self.drawn_frame: int = 0
+
+	def sync(self) -> None:
+		simulation: Simulation = self.simulation
+		bird: Bird = self.bird
+
+		# The wings flap once per simulated frame since the last draw, like Bird.update would have
+		frames: int = simulation.frame - self.drawn_frame if simulation.frame >= self.drawn_frame else simulation.frame
+		if not simulation.bird.dead:
+			for _ in range(frames):
+				bird.animate()
+
+		self.drawn_frame = simulation.frame
+		bird.y = bird.prev_y = simulation.bird.y
+		bird.angle = simulation.bird.angle
+
+		self.scroll.offset = self.scroll.prev_offset = round(simulation.frame * simulation.profile.vel_x)
+
+		pipes: Pipes = self.pipes
+		pipes.remove_pipes()
+		for sim_pipe in simulation.pipes:
+			pipes.spawn_pipe(sim_pipe.y)
+			pipe = pipes.pipes[-1]
+			pipe.x = pipe.prev_x = sim_pipe.x
+
+	def draw(self, text: str | None = None) -> pg.Surface:
+		self.sync()
+		screen: pg.Surface = self.screen
+
+		screen.blit(self.assets.image("assets/sprites/background/day.png", alpha=False), (int(self.screen_width / 1000), int(self.screen_height / -10)))
+		self.pipes.render(screen)
+		self.background.render(screen)
+		self.bird.render(screen)
+		self.score_digits.blit(screen, self.simulation.bird.score, (self.screen_width // 2, 50))
+
+		if text is not None:
+			self.text_cache.blit(screen, text, (255, 255, 255), (0, 0, 0), (self.screen_width // 2, 90))
+
+		return screen
+
+	def present(self, fps: int) -> None:
+		pg.event.pump()
+		pg.display.flip()
+		self.clock.tick(fps)
+
+	def close(self) -> None:
+		pg.quit()
@@ -0,0 +1,339 @@
+import random
+
+# Pure-Python game rules shared by Bird/Pipes and the headless Simulation (no pygame, no display, no mixer)
+
+FLOOR_Y: float = 510
+CEILING_Y: float = -35
+
+class PhysicsProfile:
+	__slots__ = ("name", "fps", "vel_x", "gravity", "jump_strength", "max_timer", "min_timer", "decrement_value", "decrement_factor")
+
+	def __init__(self, name: str, fps: int, vel_x: float, gravity: float, jump_strength: float, max_timer: float = 200, min_timer: float = 120, decrement_value: float = 0.1, decrement_factor: float = 0.3) -> None:
+		self.name: str = name
+		self.fps: int = fps
+
+		self.vel_x: float = vel_x
+		self.gravity: float = gravity
+		self.jump_strength: float = jump_strength
+
+		self.max_timer: float = max_timer
+		self.min_timer: float = min_timer
+		self.decrement_value: float = decrement_value
+		self.decrement_factor: float = decrement_factor
+
+	def __repr__(self) -> str:
+		return f"PhysicsProfile({self.name!r})"
+
+	def __reduce__(self) -> tuple:
+		return (PhysicsProfile, (self.name, self.fps, self.vel_x, self.gravity, self.jump_strength, self.max_timer, self.min_timer, self.decrement_value, self.decrement_factor))
+
+# Values from the comments in Bird.__init__ and the modes in Bird.handle_mode
+PROFILES: dict[str, PhysicsProfile] = {
+	"normal": PhysicsProfile("normal", 90, 4, 0.3, -7.5),
+	"normal_60": PhysicsProfile("normal_60", 60, 5, 0.5, -10),
+	"impossible": PhysicsProfile("impossible", 90, 10, 0.3, -7.5),
+}
+
+def pixel(value: float) -> int:
+	# Matches how pg.Rect rounds float positions (half away from zero)
+	return int(value + 0.5) if value >= 0 else -int(-value + 0.5)
+
+def fall(y: float, vel_y: float, gravity: float) -> tuple[float, float]:
+	y += vel_y
+	vel_y += gravity
+
+	if y >= FLOOR_Y or y < 0:
+		y = min(y, FLOOR_Y)
+
+	if y < CEILING_Y:
+		y = CEILING_Y
+		vel_y = 0
+
+	return y, vel_y
+
+def next_angle(angle: float, vel_y: float, max_angle: float, min_angle: float, angle_acceleration: float) -> float:
+	if vel_y < 0 and angle < max_angle:
+		return max_angle
+
+	elif vel_y >= 0 and angle > min_angle:
+		return angle - angle_acceleration
+
+	return angle
+
+def advance_spawn_timer(timer: float, max_timer: float, min_timer: float, decrement: float) -> tuple[float, float, bool]:
+	if timer <= 0:
+		return max_timer, max(min_timer, max_timer - 2.5), True
+
+	return timer - decrement, max_timer, False
+
+def hits_pipe(left: int, top: int, width: int, height: int, pipe_x: int, pipe_y: int, pipe_width: int, gap: int, screen_height: int) -> bool:
+	# Same test as colliding pg.Rect(left, top, width, height) with the upper and lower pipe rects
+	if not (left < pipe_x + pipe_width and pipe_x < left + width):
+		return False
+
+	if pipe_y > 0 and top < pipe_y and 0 < top + height:
+		return True
+
+	lower_top: int = pipe_y + gap
+	lower_height: int = screen_height - lower_top
+
+	return lower_height > 0 and top < screen_height and lower_top < top + height
+
+class SimBird:
+	__slots__ = ("x", "y", "vel_y", "angle", "distance", "score", "dead")
+
+	def __init__(self, x: int = 50, y: float = 250, vel_y: float = 0) -> None:
+		self.x: int = x
+		self.y: float = y
+		self.vel_y: float = vel_y
+		self.angle: float = 0
+		self.distance: float = 0
+		self.score: int = 0
+		self.dead: bool = False
+
+class SimPipe:
+	__slots__ = ("x", "y", "speed", "score_increment")
+
+	def __init__(self, x: int, y: int, speed: float) -> None:
+		self.x: float = x
+		self.y: int = y
+		self.speed: float = speed
+		self.score_increment: bool = True
+
+class Obstacle:
+	__slots__ = ("index", "frame", "x", "gap_y")
+
+	def __init__(self, index: int, frame: int, x: float, gap_y: int) -> None:
+		self.index: int = index
+		self.frame: int = frame # play frame the pipe enters the screen on
+		self.x: float = x # course position of its left edge, on screen at x minus the distance travelled
+		self.gap_y: int = gap_y
+
+	def __repr__(self) -> str:
+		return f"Obstacle({self.index}, x={self.x}, gap_y={self.gap_y})"
+
+class Course:
+	# The obstacles of one run as an indexable sequence, generated lazily from the run's own RNG stream so a seed always gives the same course
+	def __init__(self, profile: PhysicsProfile, seed: int | None = None, screen_width: int = 800, screen_height: int = 600, window: int = 64) -> None:
+		self.profile: PhysicsProfile = profile
+
+		self.screen_width: int = screen_width
+		self.screen_height: int = screen_height
+		self.min_gap_y: int = 50
+		self.max_gap_y: int = screen_height - 300
+
+		# Difficulty curve: spacing shrinks by 2.5 timer units per pipe down to min_timer, and a gap can only move
+		# start_jump pixels from the previous one at first, widening to the full range by ramp_obstacles
+		self.start_jump: int = 150
+		self.ramp_obstacles: int = 20
+
+		# Obstacles kept around the last one asked for, anything further back is regenerated from the seed
+		self.window: int = window
+		self.rng: random.Random = random.Random()
+		self.reset(seed)
+
+	def reset(self, seed: int | None = None, profile: PhysicsProfile | None = None) -> None:
+		if profile is not None:
+			self.profile = profile
+
+		self.seed: int = random.randrange(2 ** 32) if seed is None else seed
+		self.restart()
+
+	def restart(self) -> None:
+		self.rng.seed(self.seed)
+		self.timer: float = self.profile.max_timer
+		self.max_timer: float = self.profile.max_timer
+		self.frame: int = 0
+		self.previous_gap_y: int | None = None
+
+		self.base: int = 0
+		self.cache: list[Obstacle] = []
+
+	def max_jump(self, index: int) -> int:
+		full: int = self.max_gap_y - self.min_gap_y
+		if index >= self.ramp_obstacles:
+			return full
+
+		return int(self.start_jump + (full - self.start_jump) * index / self.ramp_obstacles)
+
+	def generate(self) -> Obstacle:
+		# Walks the same spawn timer the game used to run every frame, so spacing matches it to the frame
+		profile: PhysicsProfile = self.profile
+		decrement: float = profile.decrement_value + profile.vel_x * profile.decrement_factor
+		while True:
+			frame: int = self.frame
+			self.frame += 1
+			self.timer, self.max_timer, spawn = advance_spawn_timer(self.timer, self.max_timer, profile.min_timer, decrement)
+			if spawn:
+				break
+
+		index: int = self.base + len(self.cache)
+		low, high = self.min_gap_y, self.max_gap_y
+		if self.previous_gap_y is not None:
+			jump: int = self.max_jump(index)
+			low, high = max(low, self.previous_gap_y - jump), min(high, self.previous_gap_y + jump)
+
+		gap_y: int = self.rng.randint(low, high)
+		self.previous_gap_y = gap_y
+
+		return Obstacle(index, frame, self.screen_width + frame * profile.vel_x, gap_y)
+
+	def __getitem__(self, index: int) -> Obstacle:
+		if index < 0:
+			raise IndexError(f"obstacle index {index} is negative, the course has no end to count back from")
+
+		if index < self.base:
+			self.restart()
+
+		cache: list[Obstacle] = self.cache
+		while self.base + len(cache) <= index:
+			cache.append(self.generate())
+			if len(cache) > 2 * self.window:
+				dropped: int = len(cache) - self.window
+				del cache[:dropped]
+				self.base += dropped
+
+		return cache[index - self.base]
+
+	def lookahead(self, index: int, count: int) -> list[Obstacle]:
+		return [self[i] for i in range(index, index + count)]
+
+class PipeCourse:
+	def __init__(self, profile: PhysicsProfile, seed: int | None = None, screen_width: int = 800, screen_height: int = 600, bird_x: int = 50) -> None:
+		self.profile: PhysicsProfile = profile
+
+		self.screen_width: int = screen_width
+		self.screen_height: int = screen_height
+		self.bird_x: int = bird_x
+
+		self.pipe_width: int = 104
+		self.gap: int = 200
+
+		self.course: Course = Course(profile, seed, screen_width, screen_height)
+		self.reset(seed)
+
+	@property
+	def seed(self) -> int:
+		return self.course.seed
+
+	def reset(self, seed: int | None = None) -> None:
+		self.course.reset(seed)
+
+		self.pipes: list[SimPipe] = []
+		self.frame: int = 0
+		self.next_obstacle: int = 0
+
+	def advance(self) -> int:
+		# Pipes part of one "play" frame (Pipes.update), returns how many pipes the bird passed
+		obstacle: Obstacle = self.course[self.next_obstacle]
+		if obstacle.frame == self.frame:
+			self.pipes.append(SimPipe(self.screen_width, obstacle.gap_y, self.profile.vel_x))
+			self.next_obstacle += 1
+
+		self.frame += 1
+
+		pipes: list[SimPipe] = self.pipes
+		if pipes and pipes[0].x <= -self.pipe_width:
+			self.pipes = pipes = [pipe for pipe in pipes if pipe.x > -self.pipe_width]
+
+		passed: int = 0
+		for pipe in pipes:
+			pipe.x -= pipe.speed
+			if pipe.x <= self.bird_x and pipe.score_increment:
+				pipe.score_increment = False
+				passed += 1
+
+		return passed
+
+class Simulation:
+	def __init__(self, profile: PhysicsProfile | str = "normal", seed: int | None = None, screen_width: int = 800, screen_height: int = 600) -> None:
+		self.profile: PhysicsProfile = PROFILES[profile] if isinstance(profile, str) else profile
+
+		self.screen_width: int = screen_width
+		self.screen_height: int = screen_height
+
+		self.bird_width: int = 50
+		self.bird_height: int = 50
+
+		self.max_angle: float = 30
+		self.min_angle: float = -30
+		self.angle_acceleration: float = 2
+
+		self.course: PipeCourse = PipeCourse(self.profile, seed, screen_width, screen_height)
+		self.pipe_width: int = self.course.pipe_width
+		self.gap: int = self.course.gap
+
+		self.reset(seed)
+
+	@property
+	def seed(self) -> int:
+		return self.course.seed
+
+	@property
+	def pipes(self) -> list[SimPipe]:
+		return self.course.pipes
+
+	def reset(self, seed: int | None = None, y: float = 250, vel_y: float = 0) -> None:
+		self.course.reset(seed)
+		self.bird: SimBird = SimBird(self.course.bird_x, y, vel_y)
+		self.frame: int = 0
+
+	def step(self, flap: bool = False) -> bool:
+		# Same order as one "play" step of FlappyBirdGame: input, then pipes, then bird
+		bird: SimBird = self.bird
+		if bird.dead:
+			return False
+
+		profile: PhysicsProfile = self.profile
+		if flap:
+			bird.vel_y = profile.jump_strength
+
+		bird.score += self.course.advance()
+
+		left: int = pixel(bird.x + 15)
+		top: int = pixel(bird.y + 10)
+		for pipe in self.course.pipes:
+			if hits_pipe(left, top, self.bird_width, self.bird_height, int(pipe.x), pipe.y, self.pipe_width, self.gap, self.screen_height):
+				bird.dead = True
+				break
+
+		if bird.y >= FLOOR_Y:
+			bird.dead = True
+
+		if bird.dead:
+			bird.vel_y = 0
+
+		bird.angle = next_angle(bird.angle, bird.vel_y, self.max_angle, self.min_angle, self.angle_acceleration)
+		bird.y, bird.vel_y = fall(bird.y, bird.vel_y, profile.gravity)
+		if not bird.dead:
+			bird.distance += profile.vel_x
+
+		self.frame += 1
+
+		return not bird.dead
+
+	def run(self, controller, max_frames: int = 100_000) -> int:
+		# controller(simulation) -> bool, called once per frame to decide whether to flap
+		while self.frame < max_frames and self.step(controller(self)):
+			pass
+
+		return self.bird.score
+
+	def next_pipe(self) -> SimPipe | None:
+		for pipe in self.course.pipes:
+			if pipe.x + self.pipe_width > self.bird.x:
+				return pipe
+
+		return None
+
+def gap_flap(y, vel_y, pipe_y: int | None, gap: int, aim: float = 0.6):
+	# The gap-following bot the benchmarks, tournament and environment play with: flap while falling below aim of the way
+	# down the next gap. Takes one bird's floats or NumPy arrays of birds (and of aims)
+	target = pipe_y + gap * aim if pipe_y is not None else 300
+
+	return (y > target) & (vel_y > 0)
+
+def gap_controller(simulation: Simulation) -> bool:
+	pipe: SimPipe | None = simulation.next_pipe()
+
+	return gap_flap(simulation.bird.y, simulation.bird.vel_y, pipe.y if pipe else None, simulation.gap)
@@ -0,0 +1,104 @@
+import threading
+import os
+import re
+
+from pathlib import Path
+
+class SkinCatalog:
+	def __init__(self, player_dir: str = "assets/sprites/player", stationary_file: str = "assets/sprites/player/data_stationary.txt") -> None:
+		self.player_dir: Path = Path(player_dir)
+		self.stationary_file: str = stationary_file
+
+		self.names: list[str] = []
+		self.stationary: list[str] = []
+		self.frame_paths: dict[str, list[str]] = {}
+
+		# Set by the watcher (or by anything that touches the folder) to request a rescan on the next frame
+		self.dirty: bool = False
+		self.watcher: threading.Thread | None = None
+		self.stop: threading.Event = threading.Event()
+		self.signature: tuple[tuple[str, int], ...] = ()
+
+		self.refresh()
+
+	def read_stationary(self) -> list[str]:
+		try:
+			with open(self.stationary_file, "r") as file:
+				return [folder.strip() for folder in file.readlines()]
+
+		except FileNotFoundError:
+			return []
+
+	def refresh(self) -> None:
+		stationary: list[str] = self.read_stationary()
+
+		names: list[str] = []
+		frame_paths: dict[str, list[str]] = {}
+		for folder in self.player_dir.iterdir():
+			if folder.is_dir():
+				pngs: list[str] = [file for file in os.listdir(folder) if file.endswith('.png')]
+				if pngs:
+					pngs.sort(key=self.frame_number)
+					names.append(folder.name)
+					frame_paths[folder.name] = [str(folder / file) for file in pngs]
+
+		self.names = names
+		self.stationary = stationary
+		self.frame_paths = frame_paths
+		self.signature = self.scan_signature()
+		self.dirty = False
+
+	@staticmethod
+	def frame_number(file_name: str) -> int:
+		match: re.Match | None = re.search(r'(\d+)\.png$', file_name)
+
+		return int(match.group(1)) if match else 0
+
+	def frames_count(self, skin: str) -> int:
+		return len(self.frame_paths.get(skin, ()))
+
+	def mark_dirty(self) -> None:
+		self.dirty = True
+
+	def scan_signature(self) -> tuple[tuple[str, int], ...]:
+		entries: list[tuple[str, int]] = []
+		try:
+			entries.append((self.stationary_file, os.stat(self.stationary_file).st_mtime_ns))
+
+		except FileNotFoundError:
+			pass
+
+		with os.scandir(self.player_dir) as folders:
+			for folder in folders:
+				if folder.is_dir():
+					entries.append((folder.name, folder.stat().st_mtime_ns))
+
+		entries.sort()
+
+		return tuple(entries)
+
+	def start_watcher(self, interval: float = 1.0) -> None:
+		if self.watcher is not None:
+			return
+
+		self.stop.clear()
+		self.watcher = threading.Thread(target=self.watch, args=(interval,), daemon=True)
+		self.watcher.start()
+
+	def stop_watcher(self) -> None:
+		if self.watcher is None:
+			return
+
+		# Wakes the watcher from its wait, so shutting down doesn't sit out the interval
+		self.stop.set()
+		self.watcher.join()
+		self.watcher = None
+
+	def watch(self, interval: float) -> None:
+		while not self.stop.wait(interval):
+			try:
+				if self.scan_signature() != self.signature:
+					self.dirty = True
+
+			except OSError:
+				self.dirty = True
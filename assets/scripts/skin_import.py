@@ -0,0 +1,125 @@
+import pygame as pg
+import threading
+import tempfile
+import shutil
+import queue
+import os
+
+from typing import Callable, Iterator
+
+class SkinImport:
+	# Decodes, pre-scales, saves and pre-rotates imported skins on a worker thread, the game loop picks finished skins up with collect()
+	def __init__(self, skins: dict[str, list[tuple[str, str]]], angles: dict[str, list[int]], rotate: Callable[[pg.Surface, int], pg.Surface], size: tuple[int, int] = (50, 50), player_dir: str = "assets/sprites/player") -> None:
+		# skin -> (source path, file name in the skin folder) in frame order
+		self.skins: dict[str, list[tuple[str, str]]] = skins
+		self.angles: dict[str, list[int]] = angles
+		self.rotate: Callable[[pg.Surface, int], pg.Surface] = rotate
+		self.size: tuple[int, int] = size
+		self.player_dir: str = player_dir
+
+		self.total: int = sum(len(files) for files in skins.values())
+		self.done: int = 0
+		self.error: str | None = None
+		self.finished: bool = False
+
+		self.results: queue.SimpleQueue = queue.SimpleQueue()
+
+		# Finished skins are converted a few surfaces per collect(), a rotating skin has hundreds of them
+		self.surfaces_per_collect: int = 32
+		self.converting: Iterator[None] | None = None
+		self.thread: threading.Thread = threading.Thread(target=self.run, daemon=True)
+
+	def start(self) -> None:
+		self.thread.start()
+
+	@property
+	def progress(self) -> float:
+		return self.done / self.total if self.total else 1
+
+	def fit(self, image: pg.Surface) -> pg.Surface:
+		# Scaled to fit the bird's footprint, keeping the aspect ratio
+		width, height = image.get_size()
+		scale: float = min(self.size[0] / width, self.size[1] / height)
+		size: tuple[int, int] = (max(1, round(width * scale)), max(1, round(height * scale)))
+
+		if image.get_bitsize() >= 24:
+			return pg.transform.smoothscale(image, size)
+
+		return pg.transform.scale(image, size)
+
+	def run(self) -> None:
+		try:
+			for skin, files in self.skins.items():
+				self.import_skin(skin, files)
+
+		except Exception as error:
+			# Anything escaping the worker would leave the creator waiting on an import that never finishes
+			self.error = str(error) or type(error).__name__
+
+		finally:
+			self.finished = True
+
+	def import_skin(self, skin: str, files: list[tuple[str, str]]) -> None:
+		# Built in a scratch folder and moved in at the end, so the catalog never scans a half-imported skin
+		scratch: str = tempfile.mkdtemp(dir=os.path.dirname(os.path.normpath(self.player_dir)))
+		try:
+			frames: list[pg.Surface] = []
+			rotations: dict[tuple[int, int], tuple[pg.Surface, pg.Mask]] = {}
+			for frame_index, (source, file_name) in enumerate(files):
+				image: pg.Surface = self.fit(pg.image.load(source))
+				pg.image.save(image, os.path.join(scratch, file_name))
+				frames.append(image)
+
+				for angle in self.angles[skin]:
+					rotated: pg.Surface = self.rotate(image, angle)
+					rotations[(frame_index, angle)] = (rotated, pg.mask.from_surface(rotated))
+
+				self.done += 1
+
+			os.rename(scratch, os.path.join(self.player_dir, skin))
+
+		except BaseException:
+			shutil.rmtree(scratch, ignore_errors=True)
+			raise
+
+		self.results.put((skin, frames, rotations))
+
+	def collect(self, assets: 'AssetManager') -> bool: # type: ignore
+		# Converting to the display format happens here on the main thread, True once the job is over and every skin is handed over
+		budget: int = self.surfaces_per_collect
+		while budget > 0:
+			if self.converting is None:
+				try:
+					skin, frames, rotations = self.results.get_nowait()
+
+				except queue.Empty:
+					break
+
+				self.converting = self.convert(assets, skin, frames, rotations)
+
+			try:
+				next(self.converting)
+				budget -= 1
+
+			except StopIteration:
+				self.converting = None
+
+		return self.finished and self.converting is None and self.results.empty()
+
+	def convert(self, assets: 'AssetManager', skin: str, frames: list[pg.Surface], rotations: dict[tuple[int, int], tuple[pg.Surface, pg.Mask]]) -> Iterator[None]: # type: ignore
+		# Yields after each surface, the skin only reaches the asset manager once all of them are converted and pre-scaled
+		converted_frames: list[pg.Surface] = []
+		for frame in frames:
+			converted: pg.Surface = frame.convert_alpha()
+			assets.prescale(converted)
+			converted_frames.append(converted)
+			yield
+
+		converted_rotations: dict[tuple[int, int], tuple[pg.Surface, pg.Mask]] = {}
+		for key, (rotated, mask) in rotations.items():
+			converted = rotated.convert_alpha()
+			assets.prescale(converted)
+			converted_rotations[key] = (converted, mask)
+			yield
+
+		assets.add_imported_skin(skin, converted_frames, converted_rotations)
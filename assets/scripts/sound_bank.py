@@ -0,0 +1,64 @@
+import pygame as pg
+import os
+
+class SoundBank:
+	# Every wav decoded once and keyed by name ("sfx_flap.wav" -> "flap"), played through a fixed pool of reserved channels
+	def __init__(self, directory: str = "assets/sounds/player", channels: int = 4, max_per_frame: int = 2) -> None:
+		if not pg.mixer.get_init():
+			pg.mixer.init()
+
+		self.sounds: dict[str, pg.mixer.Sound] = {}
+		for file_name in sorted(os.listdir(directory)):
+			if file_name.endswith(".wav"):
+				name: str = os.path.splitext(file_name)[0].removeprefix("sfx_")
+				self.sounds[name] = pg.mixer.Sound(os.path.join(directory, file_name))
+
+		# Reserved channels are never picked by pg.mixer for other sounds, so the pool is ours alone
+		pg.mixer.set_reserved(channels)
+		self.channels: list[pg.mixer.Channel] = [pg.mixer.Channel(index) for index in range(channels)]
+		self.next_channel: int = 0
+
+		self.volume: float = -1
+		self.max_per_frame: int = max_per_frame
+
+		# Sounds requested this frame, a dict keeps them ordered and plays each name at most once
+		self.queued: dict[str, None] = {}
+		self.dropped: int = 0
+
+	def set_volume(self, volume: float) -> None:
+		if volume == self.volume:
+			return
+
+		for channel in self.channels:
+			channel.set_volume(volume)
+
+		self.volume = volume
+
+	def play(self, name: str) -> None:
+		self.queued[name] = None
+
+	def channel(self) -> pg.mixer.Channel:
+		for channel in self.channels:
+			if not channel.get_busy():
+				return channel
+
+		# Every channel busy: steal them in turn
+		channel: pg.mixer.Channel = self.channels[self.next_channel]
+		self.next_channel = (self.next_channel + 1) % len(self.channels)
+
+		return channel
+
+	def flush(self) -> None:
+		# Called once per step, plays the coalesced requests and drops whatever is past the per-frame budget
+		if not self.queued:
+			return
+
+		for index, name in enumerate(self.queued):
+			if index >= self.max_per_frame:
+				self.dropped += len(self.queued) - index
+				break
+
+			if self.volume != 0:
+				self.channel().play(self.sounds[name])
+
+		self.queued.clear()
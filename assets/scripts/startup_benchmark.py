@@ -0,0 +1,85 @@
+import subprocess
+import argparse
+import json
+import time
+import sys
+import os
+
+# Each run is a fresh interpreter, timed from the moment the parent spawns it
+STAGES: tuple[str, ...] = ("interpreter_ms", "import_ms", "first_frame_ms", "first_game_frame_ms")
+
+def child(spawn_time: float) -> None:
+	start: float = time.time()
+	os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+	os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+	import pygame as pg
+	from main import FlappyBirdGame
+
+	imported: float = time.time()
+
+	class FirstFrameGame(FlappyBirdGame):
+		def __init__(self) -> None:
+			self.first_frame: float | None = None
+			self.first_game_frame: float | None = None
+			super().__init__()
+
+		def render_loading(self) -> None:
+			super().render_loading()
+			if self.first_frame is None:
+				self.first_frame = time.time()
+
+		def run_game(self) -> None:
+			self.running = True
+
+			self.handle_events()
+			self.step()
+			self.render(1)
+			self.present()
+			self.first_game_frame = time.time()
+
+			self.scores.close()
+			pg.quit()
+
+	game: FirstFrameGame = FirstFrameGame()
+	print(json.dumps({
+		"interpreter_ms": (start - spawn_time) * 1000,
+		"import_ms": (imported - start) * 1000,
+		"first_frame_ms": (game.first_frame - spawn_time) * 1000,
+		"first_game_frame_ms": (game.first_game_frame - spawn_time) * 1000,
+	}))
+
+def run_once() -> dict[str, float]:
+	spawn_time: float = time.time()
+	output: str = subprocess.run([sys.executable, __file__, "--child", repr(spawn_time)], capture_output=True, text=True, check=True).stdout
+
+	return json.loads(output.strip().splitlines()[-1])
+
+def main() -> None:
+	parser: argparse.ArgumentParser = argparse.ArgumentParser(description="Time from launching the game to its first frame, in fresh processes.")
+	parser.add_argument("--runs", type=int, default=10)
+	parser.add_argument("--target", type=float, default=300, help="first frame budget in ms")
+	parser.add_argument("--output", help="write every run as JSON")
+	parser.add_argument("--child", type=float, help=argparse.SUPPRESS)
+	args: argparse.Namespace = parser.parse_args()
+
+	if args.child is not None:
+		child(args.child)
+		return
+
+	runs: list[dict[str, float]] = [run_once() for _ in range(args.runs)]
+
+	print(f"{'':<22} {'min ms':>8} {'median ms':>10} {'max ms':>8}")
+	for stage in STAGES:
+		samples: list[float] = sorted(run[stage] for run in runs)
+		print(f"{stage:<22} {samples[0]:>8.1f} {samples[len(samples) // 2]:>10.1f} {samples[-1]:>8.1f}")
+
+	median_first_frame: float = sorted(run["first_frame_ms"] for run in runs)[len(runs) // 2]
+	print(f"first frame {'within' if median_first_frame <= args.target else 'over'} the {args.target:.0f} ms target")
+
+	if args.output:
+		with open(args.output, "w") as file:
+			json.dump({"runs": runs, "python": sys.version.split()[0]}, file, indent=4)
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,62 @@
+import pygame as pg
+
+from enum import Enum
+from typing import Callable
+
+class State(Enum):
+	MAIN = "main"
+	PLAY = "play"
+	DEATH = "death"
+	CREATOR = "creator"
+	DELETE = "delete"
+
+class StateMachine:
+	# Systems are (owner, method name) pairs looked up when called, so instance-level wrappers like the profiler's still apply
+	def __init__(self, initial: State = State.MAIN) -> None:
+		self.state: State = initial
+
+		self.updates: dict[State, list[tuple[object, str]]] = {state: [] for state in State}
+		self.renders: dict[State, list[tuple[object, str]]] = {state: [] for state in State}
+		self.enter_hooks: dict[State, list[Callable[[], None]]] = {state: [] for state in State}
+		self.exit_hooks: dict[State, list[Callable[[], None]]] = {state: [] for state in State}
+
+	def add_update(self, owner: object, method: str, *states: State) -> None:
+		for state in states:
+			self.updates[state].append((owner, method))
+
+	def add_render(self, owner: object, method: str, *states: State) -> None:
+		for state in states:
+			self.renders[state].append((owner, method))
+
+	def on_enter(self, hook: Callable[[], None], *states: State) -> None:
+		for state in states:
+			self.enter_hooks[state].append(hook)
+
+	def on_exit(self, hook: Callable[[], None], *states: State) -> None:
+		for state in states:
+			self.exit_hooks[state].append(hook)
+
+	def start(self) -> None:
+		# The initial state is entered without a change, its enter hooks run once everything has registered
+		for hook in self.enter_hooks[self.state]:
+			hook()
+
+	def change(self, state: State) -> None:
+		if state is self.state:
+			return
+
+		for hook in self.exit_hooks[self.state]:
+			hook()
+
+		self.state = state
+		for hook in self.enter_hooks[state]:
+			hook()
+
+	def update(self) -> None:
+		# The list is the one of the state the step started in, a transition takes effect from the next step
+		for owner, method in self.updates[self.state]:
+			getattr(owner, method)()
+
+	def render(self, screen: pg.Surface, alpha: float) -> None:
+		for owner, method in self.renders[self.state]:
+			getattr(owner, method)(screen, alpha)
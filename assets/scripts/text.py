@@ -0,0 +1,87 @@
+import pygame as pg
+
+from collections import OrderedDict
+
+class TextCache:
+	# Rendered (outline, fill) surface pairs keyed by (text, color, outline color), least recently used evicted first
+	def __init__(self, font: pg.font.Font, max_entries: int = 64, outline_offset: int = 3, scaled_font: pg.font.Font | None = None, assets: 'AssetManager | None' = None) -> None: # type: ignore
+		self.font: pg.font.Font = font
+		self.max_entries: int = max_entries
+		self.outline_offset: int = outline_offset
+		self.renders: int = 0
+
+		# When rendering above the logical resolution, text is also rendered at the output size instead of being scaled up
+		self.scaled_font: pg.font.Font | None = scaled_font
+		self.assets: 'AssetManager | None' = assets # type: ignore
+
+		self.entries: OrderedDict[tuple[str, tuple[int, int, int], tuple[int, int, int] | None], tuple[pg.Surface | None, pg.Surface]] = OrderedDict()
+
+	def get(self, text: str, color: tuple[int, int, int], outline_color: tuple[int, int, int] | None = None) -> tuple[pg.Surface | None, pg.Surface]:
+		key: tuple[str, tuple[int, int, int], tuple[int, int, int] | None] = (text, color, outline_color)
+		entry: tuple[pg.Surface | None, pg.Surface] | None = self.entries.get(key)
+		if entry is not None:
+			self.entries.move_to_end(key)
+			return entry
+
+		outline_surface: pg.Surface | None = self.font.render(text, True, outline_color) if outline_color is not None else None
+		entry = (outline_surface, self.font.render(text, True, color))
+		self.renders += 2 if outline_surface is not None else 1
+
+		if self.scaled_font is not None:
+			if outline_surface is not None:
+				self.assets.add_variant(outline_surface, self.scaled_font.render(text, True, outline_color))
+
+			self.assets.add_variant(entry[1], self.scaled_font.render(text, True, color))
+
+		self.entries[key] = entry
+		if len(self.entries) > self.max_entries:
+			self.entries.popitem(last=False)
+
+		return entry
+
+	def blit(self, screen: pg.Surface, text: str, color: tuple[int, int, int], outline_color: tuple[int, int, int] | None, center: tuple[float, float]) -> None:
+		outline_surface, text_surface = self.get(text, color, outline_color)
+		if outline_surface is not None:
+			screen.blit(outline_surface, outline_surface.get_rect(center=(center[0], center[1] + self.outline_offset)))
+
+		screen.blit(text_surface, text_surface.get_rect(center=center))
+
+class DigitAtlas:
+	# Pre-rendered 0-9 glyphs so numbers are composed from blits instead of rendering the string every frame
+	def __init__(self, font: pg.font.Font, color: tuple[int, int, int], outline_color: tuple[int, int, int] | None = None, outline_offset: int = 3, scaled_font: pg.font.Font | None = None, assets: 'AssetManager | None' = None) -> None: # type: ignore
+		self.outline_offset: int = outline_offset
+		self.height: int = font.get_height()
+
+		self.glyphs: dict[str, tuple[pg.Surface | None, pg.Surface, int]] = {}
+		for digit in "0123456789-":
+			advance: int = font.size(digit)[0]
+			outline_surface: pg.Surface | None = font.render(digit, True, outline_color) if outline_color is not None else None
+			self.glyphs[digit] = (outline_surface, font.render(digit, True, color), advance)
+
+			if scaled_font is not None:
+				if outline_surface is not None:
+					assets.add_variant(outline_surface, scaled_font.render(digit, True, outline_color))
+
+				assets.add_variant(self.glyphs[digit][1], scaled_font.render(digit, True, color))
+
+	def width(self, text: str) -> int:
+		return sum(self.glyphs[char][2] for char in text)
+
+	def blit(self, screen: pg.Surface, value: int, center: tuple[float, float]) -> None:
+		text: str = str(value)
+		rect: pg.Rect = pg.Rect(0, 0, self.width(text), self.height)
+		rect.center = center
+
+		# Outlines first so no fill is covered by the next digit's outline
+		x: int = rect.left
+		for char in text:
+			outline_surface, _, advance = self.glyphs[char]
+			if outline_surface is not None:
+				screen.blit(outline_surface, (x, rect.top + self.outline_offset))
+			x += advance
+
+		x = rect.left
+		for char in text:
+			_, text_surface, advance = self.glyphs[char]
+			screen.blit(text_surface, (x, rect.top))
+			x += advance
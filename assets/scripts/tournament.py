@@ -0,0 +1,114 @@
+import argparse
+import statistics
+import random
+import json
+import time
+import os
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable
+from simulation import PROFILES, Simulation, gap_controller as follow_gap
+
+# Controllers are plain functions so they can be sent to worker processes by name
+def gap_controller(simulation: Simulation, rng: random.Random) -> bool:
+	return follow_gap(simulation)
+
+def cautious_controller(simulation: Simulation, rng: random.Random) -> bool:
+	pipe = simulation.next_pipe()
+	target: float = pipe.y + simulation.gap * 0.45 if pipe else 250
+
+	return simulation.bird.y > target and simulation.bird.vel_y > -1
+
+def random_controller(simulation: Simulation, rng: random.Random) -> bool:
+	return simulation.bird.vel_y > 0 and rng.random() < 0.08
+
+CONTROLLERS: dict[str, Callable[[Simulation, random.Random], bool]] = {
+	"gap": gap_controller,
+	"cautious": cautious_controller,
+	"random": random_controller,
+}
+
+def run_chunk(profile_name: str, controller_name: str, seeds: list[int], max_frames: int) -> tuple[str, str, list[tuple[int, int, int]]]:
+	controller = CONTROLLERS[controller_name]
+	simulation: Simulation = Simulation(profile_name)
+	rng: random.Random = random.Random()
+	results: list[tuple[int, int, int]] = []
+
+	for seed in seeds:
+		simulation.reset(seed)
+		rng.seed(seed)
+		while simulation.frame < max_frames and simulation.step(controller(simulation, rng)):
+			pass
+
+		results.append((seed, simulation.bird.score, simulation.frame))
+
+	return profile_name, controller_name, results
+
+def summarize(results: list[tuple[int, int, int]], max_frames: int) -> dict[str, float]:
+	scores: list[int] = [score for _, score, _ in results]
+	frames: list[int] = [frame for _, _, frame in results]
+	quantiles: list[float] = statistics.quantiles(scores, n=20) if len(scores) > 1 else [scores[0]] * 19
+
+	return {
+		"runs": len(results),
+		"mean_score": statistics.fmean(scores),
+		"median_score": statistics.median(scores),
+		"p95_score": quantiles[18],
+		"max_score": max(scores),
+		"mean_frames": statistics.fmean(frames),
+		"survived": sum(frame >= max_frames for frame in frames) / len(frames),
+	}
+
+def run_tournament(seeds: list[int], profiles: list[str], controllers: list[str], max_frames: int, workers: int | None = None, chunk_size: int = 64) -> dict[str, dict[str, dict[str, float]]]:
+	collected: dict[tuple[str, str], list[tuple[int, int, int]]] = {(profile, controller): [] for profile in profiles for controller in controllers}
+
+	with ProcessPoolExecutor(max_workers=workers) as executor:
+		futures = [
+			executor.submit(run_chunk, profile, controller, seeds[start:start + chunk_size], max_frames)
+			for profile in profiles
+			for controller in controllers
+			for start in range(0, len(seeds), chunk_size)
+		]
+
+		for future in futures:
+			profile, controller, results = future.result()
+			collected[(profile, controller)].extend(results)
+
+	summary: dict[str, dict[str, dict[str, float]]] = {}
+	for (profile, controller), results in collected.items():
+		summary.setdefault(profile, {})[controller] = summarize(results, max_frames)
+
+	return summary
+
+def main() -> None:
+	parser: argparse.ArgumentParser = argparse.ArgumentParser(description="Run headless FlappyBird games over a matrix of pipe seeds, physics profiles and controllers.")
+	parser.add_argument("--seeds", type=int, default=1000, help="number of pipe seeds per profile/controller pair")
+	parser.add_argument("--first-seed", type=int, default=0)
+	parser.add_argument("--profiles", nargs="+", default=list(PROFILES), choices=list(PROFILES))
+	parser.add_argument("--controllers", nargs="+", default=list(CONTROLLERS), choices=list(CONTROLLERS))
+	parser.add_argument("--max-frames", type=int, default=20_000, help="frames after which a run counts as survived")
+	parser.add_argument("--workers", type=int, default=os.cpu_count())
+	parser.add_argument("--chunk-size", type=int, default=64, help="seeds per worker task")
+	parser.add_argument("--json", help="write the summary to this file")
+	args: argparse.Namespace = parser.parse_args()
+
+	seeds: list[int] = list(range(args.first_seed, args.first_seed + args.seeds))
+
+	start: float = time.perf_counter()
+	summary: dict[str, dict[str, dict[str, float]]] = run_tournament(seeds, args.profiles, args.controllers, args.max_frames, args.workers, args.chunk_size)
+	elapsed: float = time.perf_counter() - start
+
+	print(f"{'profile':<12} {'controller':<10} {'runs':>6} {'mean':>8} {'median':>7} {'p95':>6} {'max':>5} {'frames':>9} {'survived':>9}")
+	for profile, controllers in summary.items():
+		for controller, stats in controllers.items():
+			print(f"{profile:<12} {controller:<10} {stats['runs']:>6} {stats['mean_score']:>8.2f} {stats['median_score']:>7.1f} {stats['p95_score']:>6.1f} {stats['max_score']:>5} {stats['mean_frames']:>9.0f} {stats['survived']:>9.1%}")
+
+	runs: int = len(seeds) * len(args.profiles) * len(args.controllers)
+	print(f"{runs} runs in {elapsed:.1f}s on {args.workers} workers")
+
+	if args.json:
+		with open(args.json, "w") as file:
+			json.dump({"seeds": [seeds[0], seeds[-1]], "max_frames": args.max_frames, "elapsed": elapsed, "results": summary}, file, indent=4)
+
+if __name__ == "__main__":
+	main()
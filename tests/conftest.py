@@ -0,0 +1,24 @@
+import os
+import sys
+
+# The game loads its files relative to the repo root and imports its modules by plain name, without a window or sound device here
+ROOT: str = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+os.chdir(ROOT)
+sys.path.insert(0, os.path.join(ROOT, "assets", "scripts"))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pytest
+
+@pytest.fixture
+def keep_high_score():
+	# Games run by a test submit their scores like any other, the saved high score is put back afterwards
+	path: str = os.path.join("assets", "data", "high_score.txt")
+	with open(path, "rb") as file:
+		saved: bytes = file.read()
+
+	yield
+
+	with open(path, "wb") as file:
+		file.write(saved)
@@ -0,0 +1,36 @@
+import pygame as pg
+
+from asset_manager import AssetManager
+from benchmark import run_benchmark
+
+def test_variant_miss_is_counted() -> None:
+	assets: AssetManager = AssetManager()
+	assets.set_scale(2)
+
+	prepared: pg.Surface = pg.Surface((10, 10), pg.SRCALPHA)
+	assets.prescale(prepared)
+	assert assets.variant(prepared).get_size() == (20, 20)
+	assert assets.variant_misses == 0
+
+	unprepared: pg.Surface = pg.Surface((10, 10), pg.SRCALPHA)
+	assets.variant(unprepared)
+	assets.variant(unprepared)
+	assert assets.variant_misses == 1
+
+def test_native_resolution_scales_nothing_while_drawing() -> None:
+	assert run_benchmark(1500, 3, output_height=1200)["variant_misses"] == 0
+
+def test_pipe_column_is_cut_to_the_pipe_width() -> None:
+	# The buildings image is wider than a pipe, the column has to match the hitbox
+	pg.display.set_mode((1, 1), pg.HIDDEN)
+	try:
+		assets: AssetManager = AssetManager()
+		assets.set_scale(2)
+		assert assets.image("assets/sprites/obstacle/building.png").get_width() > 104
+
+		column: pg.Surface = assets.pipe_column("assets/sprites/obstacle/building.png", 104, 200, True)
+		assert column.get_size() == (104, 200)
+		assert assets.variant(column).get_size() == (208, 400)
+
+	finally:
+		pg.display.quit()
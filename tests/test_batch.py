@@ -0,0 +1,33 @@
+import numpy as np
+
+from batch import BatchSimulation
+from simulation import Simulation, gap_flap
+
+# Aiming at different heights of the gap, some birds hit a pipe early and some get through every one
+AIMS: np.ndarray = np.linspace(0.2, 0.9, 8)
+
+def aimed_controller(batch: BatchSimulation) -> np.ndarray:
+	pipe = batch.next_pipe()
+
+	return gap_flap(batch.y, batch.vel_y, pipe.y if pipe else None, batch.course.gap, AIMS)
+
+def test_seeded_batch_matches_simulation() -> None:
+	frames: int = 3000
+	batch: BatchSimulation = BatchSimulation(len(AIMS), seed=5)
+	path: list[np.ndarray] = []
+	while batch.frame < frames and batch.step(aimed_controller(batch)):
+		path.append(batch.y.copy())
+
+	assert batch.alive.any() and not batch.alive.all()
+
+	for bird, aim in enumerate(AIMS):
+		simulation: Simulation = Simulation(seed=5)
+		while simulation.frame < frames:
+			pipe = simulation.next_pipe()
+			if not simulation.step(gap_flap(simulation.bird.y, simulation.bird.vel_y, pipe.y if pipe else None, simulation.gap, aim)):
+				break
+
+			assert simulation.bird.y == path[simulation.frame - 1][bird]
+
+		assert batch.score[bird] == simulation.bird.score
+		assert batch.death_frame[bird] == (simulation.frame - 1 if simulation.bird.dead else -1)
@@ -0,0 +1,8 @@
+from benchmark import run_benchmark
+
+def test_seeded_runs_repeat() -> None:
+	first: dict = run_benchmark(1500, 3)
+	second: dict = run_benchmark(1500, 3)
+
+	assert first["menu_frames"] == second["menu_frames"]
+	assert first["results"]["Pipes.update"]["calls"] == second["results"]["Pipes.update"]["calls"]
@@ -0,0 +1,55 @@
+import pygame as pg
+import pytest
+import shutil
+
+from types import SimpleNamespace
+from asset_manager import AssetManager
+from bird import Bird
+from skin_catalog import SkinCatalog
+from states import StateMachine
+
+@pytest.fixture(autouse=True)
+def display():
+	# Images are converted for a display, closed again so the games in later tests can open theirs
+	pg.display.set_mode((1, 1), pg.HIDDEN)
+	yield
+	pg.display.quit()
+
+def make_bird(player_dir) -> Bird:
+	for skin in ("yellow", "zz"):
+		shutil.copytree("assets/sprites/player/yellow", player_dir / skin)
+
+	catalog: SkinCatalog = SkinCatalog(str(player_dir), str(player_dir / "data_stationary.txt"))
+	game = SimpleNamespace(screen_width=800, screen_height=600, assets=AssetManager(), skin_catalog=catalog, scores=None, states=StateMachine(), sounds=None, pixel_perfect_collision=False)
+	bird: Bird = Bird(game, None)
+	bird.select_skin("zz")
+
+	return bird
+
+def press(bird: Bird, key: int) -> None:
+	bird.on_key(pg.event.Event(pg.KEYDOWN, key=key))
+
+def test_deleted_skin_falls_back(tmp_path) -> None:
+	bird: Bird = make_bird(tmp_path)
+
+	# What the character creator does when a skin folder is deleted
+	shutil.rmtree(tmp_path / "zz")
+	bird.assets.evict_skin("zz")
+	bird.catalog.mark_dirty()
+	bird.file_check()
+
+	assert bird.skin_selected == "yellow"
+	press(bird, pg.K_LEFT)
+	assert bird.skin_selected == "yellow"
+
+def test_removed_frame_stops_animating(tmp_path) -> None:
+	bird: Bird = make_bird(tmp_path)
+	frames: int = bird.frames_count
+
+	(tmp_path / "zz" / f"yellow{frames}.png").unlink()
+	bird.assets.evict_skin("zz")
+	bird.catalog.mark_dirty()
+	bird.file_check()
+
+	assert bird.frames_count == frames - 1
+	assert max(frame_index for frame_index, _ in bird.rotation_cache) == frames - 2
@@ -0,0 +1,29 @@
+import pytest
+
+from simulation import PROFILES, Course, Obstacle
+
+def fields(obstacle: Obstacle) -> tuple[int, int, float, int]:
+	return obstacle.index, obstacle.frame, obstacle.x, obstacle.gap_y
+
+def test_same_seed_gives_same_course_after_eviction() -> None:
+	first: Course = Course(PROFILES["normal"], 7, window=8)
+	second: Course = Course(PROFILES["normal"], 7, window=8)
+
+	obstacles = [fields(first[i]) for i in range(100)]
+	assert first.base > 0
+	assert [fields(obstacle) for obstacle in second.lookahead(0, 100)] == obstacles
+
+	# Reading back behind the window regenerates the evicted obstacles from the seed
+	assert fields(first[3]) == obstacles[3]
+	assert fields(first[99]) == obstacles[99]
+
+def test_negative_index_keeps_the_cache() -> None:
+	course: Course = Course(PROFILES["normal"], 7, window=8)
+	obstacle = fields(course[40])
+	base: int = course.base
+
+	with pytest.raises(IndexError):
+		course[-1]
+
+	assert course.base == base
+	assert fields(course[40]) == obstacle
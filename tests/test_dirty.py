@@ -0,0 +1,55 @@
+import pygame as pg
+import random
+
+from benchmark import BenchmarkGame
+from states import State
+
+class ComparedGame(BenchmarkGame):
+	# Plays the benchmark's scripted session, drawing every frame with both renderers
+	def run_game(self) -> None:
+		random.seed(self.seed)
+		self.pipes.new_run(self.seed)
+		self.record_replays = False
+		self.running = True
+		self.mismatches: list[int] = []
+		self.visited: set[State] = {self.states.state}
+
+		menu = self.states.state
+		menu_timer: int = 0
+		self.aim: float = 0.6
+		self.play_budget: int = 600
+		for frame in range(self.frames):
+			self.script_input(menu_timer)
+			self.handle_events()
+			self.step()
+
+			self.dirty_rendering = True
+			self.render(0.5)
+			dirty: pg.Surface = self.screen.copy()
+
+			self.dirty_rendering = False
+			self.render(0.5)
+			if pg.image.tobytes(dirty, "RGB") != pg.image.tobytes(self.screen, "RGB"):
+				self.mismatches.append(frame)
+
+			# The dirty renderer only repaints what changed since its own last frame
+			self.screen.blit(dirty, (0, 0))
+			self.dirty_rendering = True
+			self.present()
+
+			if self.states.state is not menu:
+				menu = self.states.state
+				self.visited.add(menu)
+				menu_timer = 0
+				self.aim = random.uniform(0.45, 0.75)
+				self.play_budget = random.randint(300, 1200)
+
+			menu_timer += 1
+
+		self.scores.close()
+		pg.quit()
+
+def test_dirty_rendering_matches_full_redraw(keep_high_score) -> None:
+	game: ComparedGame = ComparedGame(2000, 4, dirty=True)
+	assert game.visited == {State.MAIN, State.PLAY, State.DEATH}
+	assert game.mismatches == []
@@ -0,0 +1,43 @@
+import pygame as pg
+
+from main import FlappyBirdGame
+from replay import Replay, ReplayPlayer
+from simulation import gap_flap
+from states import State
+
+class RecordedGame(FlappyBirdGame):
+	# Starts one run from the main menu and plays it with a gap-following bot until the bird dies
+	def __init__(self, directory: str) -> None:
+		self.directory: str = directory
+		super().__init__()
+
+	def flap(self) -> None:
+		pg.event.post(pg.event.Event(pg.KEYDOWN, key=pg.K_SPACE, mod=0, unicode=" ", scancode=0))
+
+	def run_game(self) -> None:
+		self.recorder.directory = self.directory
+		self.running = True
+
+		self.flap()
+		for _ in range(20_000):
+			bird = self.flappy_bird
+			pipe = next((pipe for pipe in self.pipes.pipes if pipe.x + pipe.pipe_width > bird.x), None)
+			if self.states.state is State.PLAY and gap_flap(bird.y, bird.vel_y, pipe.y if pipe else None, self.pipes.gap, 0.7):
+				self.flap()
+
+			self.handle_events()
+			self.step()
+			if self.states.state is State.DEATH:
+				break
+
+		self.scores.close()
+		pg.quit()
+
+def test_recorded_run_verifies(tmp_path, keep_high_score) -> None:
+	game: RecordedGame = RecordedGame(str(tmp_path))
+	assert game.states.state is State.DEATH
+	assert game.recorder.last_path is not None
+
+	replay: Replay = Replay.load(game.recorder.last_path)
+	assert replay.score == game.flappy_bird.score > 0
+	assert ReplayPlayer(replay).verify()
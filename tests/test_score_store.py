@@ -0,0 +1,25 @@
+import os
+
+from score_store import ScoreStore
+
+def test_score_survives_a_reopen(tmp_path) -> None:
+	path: str = str(tmp_path / "high_score.txt")
+	key_file: str = str(tmp_path / "key.key")
+
+	scores: ScoreStore = ScoreStore(path, key_file)
+	assert scores.submit(12)
+	scores.close()
+
+	reopened: ScoreStore = ScoreStore(path, key_file)
+	reopened.close()
+	assert reopened.high_score == 12
+
+def test_close_without_a_key_keeps_the_score(tmp_path) -> None:
+	# The key can't be created in a folder that doesn't exist, so nothing can be written
+	missing: str = str(tmp_path / "missing")
+	scores: ScoreStore = ScoreStore(os.path.join(missing, "high_score.txt"), os.path.join(missing, "key.key"))
+	scores.submit(7)
+	scores.close()
+
+	assert scores.high_score == 7
+	assert scores.writes == 0
@@ -0,0 +1,23 @@
+from simulation import Simulation, gap_controller
+
+def trace(simulation: Simulation, frames: int = 3000) -> tuple[list[tuple[float, float]], list[int]]:
+	# The bird's path and every pipe gap in spawn order, including pipes that already scrolled off and were dropped
+	path: list[tuple[float, float]] = []
+	gaps: list[int] = []
+	while simulation.frame < frames and simulation.step(gap_controller(simulation)):
+		path.append((simulation.bird.y, simulation.bird.angle))
+		if simulation.course.next_obstacle > len(gaps):
+			gaps.append(simulation.pipes[-1].y)
+
+	return path, gaps
+
+def test_same_seed_gives_same_run() -> None:
+	first: Simulation = Simulation(seed=11)
+	path, gaps = trace(first)
+	assert first.bird.score > 5
+	assert len(gaps) > len(first.pipes)
+
+	assert trace(Simulation(seed=11)) == (path, gaps)
+
+	first.reset(11)
+	assert trace(first) == (path, gaps)
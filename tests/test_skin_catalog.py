@@ -0,0 +1,17 @@
+import time
+
+from skin_catalog import SkinCatalog
+
+def test_watcher_notices_a_new_skin_and_stops(tmp_path) -> None:
+	catalog: SkinCatalog = SkinCatalog(str(tmp_path), str(tmp_path / "data_stationary.txt"))
+	catalog.start_watcher(0.01)
+	watcher = catalog.watcher
+
+	(tmp_path / "zap").mkdir()
+	deadline: float = time.perf_counter() + 5
+	while not catalog.dirty and time.perf_counter() < deadline:
+		time.sleep(0.01)
+
+	catalog.stop_watcher()
+	assert catalog.dirty
+	assert catalog.watcher is None and not watcher.is_alive()
@@ -0,0 +1,26 @@
+import pygame as pg
+
+from asset_manager import AssetManager
+from skin_import import SkinImport
+
+def test_collect_converts_a_few_surfaces_per_call() -> None:
+	pg.display.set_mode((1, 1), pg.HIDDEN)
+	try:
+		assets: AssetManager = AssetManager()
+		job: SkinImport = SkinImport({}, {}, pg.transform.rotate)
+		frames: list[pg.Surface] = [pg.Surface((50, 50), pg.SRCALPHA) for _ in range(3)]
+		rotations = {(frame_index, angle): (pg.Surface((60, 60), pg.SRCALPHA), None) for frame_index in range(3) for angle in range(-30, 31, 2)}
+		job.results.put(("zap", frames, rotations))
+		job.finished = True
+
+		calls: int = 1
+		while not job.collect(assets):
+			assert "zap" not in assets.imported_skins
+			calls += 1
+
+		assert calls >= (len(frames) + len(rotations)) // job.surfaces_per_collect
+		assert len(assets.imported_skins["zap"]) == 3
+		assert len(assets.rotations["zap"]) == len(rotations)
+
+	finally:
+		pg.display.quit()